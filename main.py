@@ -85,6 +85,9 @@ def check_once(config_path: str, env_file: str = None, telegram_debug: bool = Fa
     monitor = Monitor(config_path, env_file, telegram_debug)
     monitor.perform_checks()
 
+    # Send the queued heartbeat before exiting
+    monitor.healthcheck.close()
+
     # Display status
     status = monitor.get_status()
     metrics = status["metrics"]["availability"]
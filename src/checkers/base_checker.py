@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, Optional
 from urllib.parse import urljoin, urlparse
 
@@ -63,6 +64,16 @@ class CheckResult:
         """Check if the result indicates a warning."""
         return self.status == CheckStatus.WARNING
 
+    @cached_property
+    def check_type_upper(self) -> str:
+        """Uppercased check type label for display."""
+        return self.check_type.upper()
+
+    @cached_property
+    def status_upper(self) -> str:
+        """Uppercased status label for display."""
+        return self.status.value.upper()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -78,6 +89,17 @@ class CheckResult:
             "details": self.details,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CheckResult":
+        """Rebuild a result from the output of to_dict()."""
+        return cls(
+            **{
+                **data,
+                "timestamp": datetime.fromisoformat(data["timestamp"]),
+                "status": CheckStatus(data["status"]),
+            }
+        )
+
 
 class BaseChecker(ABC):
     """Abstract base class for all health checkers."""
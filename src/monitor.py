@@ -13,7 +13,13 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
-from .checkers import AuthChecker, CheckResult, HealthChecker, UptimeChecker
+from .checkers import (
+    AuthChecker,
+    CheckResult,
+    CheckStatus,
+    HealthChecker,
+    UptimeChecker,
+)
 from .notifiers import ConsoleNotifier, EmailNotifier, TelegramNotifier
 from .scheduler import MonitorScheduler
 from .storage import CredentialManager, StateManager
@@ -78,6 +84,18 @@ class Monitor:
 
         self.logger.info(f"Configured to monitor {len(self.sites)} site(s)")
 
+        # Last known success per site/check type, kept in memory so the check
+        # loop does not have to go back to the state manager for it
+        self._last_success: Dict[str, Dict[str, bool]] = {}
+        for site_config in self.sites:
+            site_name = site_config.get("name", "Unknown")
+            site_success = self._last_success.setdefault(site_name, {})
+            for check_type in site_config.get("checks_enabled", []):
+                last_result = self.state_manager.get_last_result(check_type, site_name)
+                site_success[check_type] = (
+                    last_result.get("success", True) if last_result else True
+                )
+
         # Initialize notifiers (shared across all sites)
         self.notifiers = self._initialize_notifiers()
 
@@ -93,6 +111,12 @@ class Monitor:
         if self.config.get("bot", {}).get("enabled", False):
             self.bot = self._initialize_bot()
 
+        # Thread pool for email/Telegram delivery so a slow SMTP server or
+        # Telegram API call does not hold up the check cycle
+        self._notifier_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="notify"
+        )
+
         # Initialize scheduler
         self.scheduler = MonitorScheduler(self.config, blocking=False)
 
@@ -432,6 +456,7 @@ class Monitor:
         self.logger.info(f"Starting monitoring checks for {len(self.sites)} site(s)...")
         total_results = 0
         all_results_for_batch = []  # Collect all results for batch notification
+        cycle_results = []  # (result, site_name) pairs, saved once per cycle
 
         # Loop through each site
         for site_config in self.sites:
@@ -446,6 +471,10 @@ class Monitor:
                 site_name, site_config, checkers, all_results_for_batch
             )
             total_results += len(results)
+            cycle_results.extend((result, site_name) for result in results)
+
+        # Persist the whole cycle with a single state log append
+        self.state_manager.record_results(cycle_results)
 
         # Send batch notifications if we have results
         if all_results_for_batch:
@@ -487,6 +516,7 @@ class Monitor:
             List of check results
         """
         results = []
+        results_by_type: Dict[str, CheckResult] = {}
 
         try:
             # Perform checks in order: uptime -> auth -> health
@@ -499,14 +529,7 @@ class Monitor:
                     try:
                         # Skip health check if auth failed
                         if check_type == "health":
-                            auth_result = next(
-                                (
-                                    r
-                                    for r in results
-                                    if r.check_type == "authentication"
-                                ),
-                                None,
-                            )
+                            auth_result = results_by_type.get("authentication")
                             if auth_result and not auth_result.success:
                                 self.logger.warning(
                                     f"[{site_name}] Skipping health check due to authentication failure"
@@ -525,6 +548,7 @@ class Monitor:
                             result = checker.check()
 
                         results.append(result)
+                        results_by_type[result.check_type] = result
 
                         # Record metrics
                         self.metrics_collector.record_check_result(
@@ -532,23 +556,20 @@ class Monitor:
                         )
 
                         # Get previous result for comparison
+                        site_success = self._last_success.setdefault(site_name, {})
+                        previous_success = site_success.get(check_type, True)
                         previous_result_dict = self.state_manager.get_last_result(
                             check_type, site_name
                         )
-                        previous_success = True
-                        if previous_result_dict:
-                            previous_success = previous_result_dict.get("success", True)
 
-                        # Record in state manager (with site name)
-                        self.state_manager.record_result(result, site_name)
+                        # State is persisted once per cycle by perform_checks
+                        site_success[check_type] = result.success
 
                         # Collect for batch notifications if batch_results list provided
                         if batch_results is not None:
                             # Get previous result for notifiers to check state changes
                             previous_result = None
                             if previous_result_dict:
-                                from .checkers import CheckStatus
-
                                 status_str = previous_result_dict.get(
                                     "status", "SUCCESS"
                                 ).upper()
@@ -565,7 +586,11 @@ class Monitor:
                             batch_results.append((result, previous_result, site_name))
 
                         # Always send to console immediately (non-batch)
-                        self._send_console_notification(result, site_name)
+                        self._send_console_notification(
+                            result,
+                            site_name,
+                            self._get_state_change_type(result, previous_success),
+                        )
 
                     except Exception as e:
                         self.logger.error(
@@ -600,15 +625,15 @@ class Monitor:
             site_name: Name of the site being checked
         """
         # Determine if this is a state change
-        is_state_change = (previous_success and result.is_failure) or (
-            not previous_success and result.is_success
-        )
+        state_change_type = self._get_state_change_type(result, previous_success)
 
         for notifier in self.notifiers:
             try:
                 # Always show in console
                 if isinstance(notifier, ConsoleNotifier):
-                    notifier.notify(result, site_name=site_name)
+                    notifier.notify(
+                        result, site_name=site_name, state_change_type=state_change_type
+                    )
                 # For other notifiers, check if they want this notification
                 # (TelegramNotifier in debug mode will return True from should_notify)
                 else:
@@ -619,8 +644,6 @@ class Monitor:
                     previous_result = None
                     if previous_result_dict:
                         # Reconstruct a minimal CheckResult for comparison
-                        from .checkers import CheckStatus
-
                         status_str = previous_result_dict.get(
                             "status", "SUCCESS"
                         ).upper()
@@ -636,18 +659,66 @@ class Monitor:
                     # Let the notifier decide if it should notify
                     # (handles debug mode, state changes, etc.)
                     if notifier.should_notify(result, previous_result):
-                        notifier.notify(result, previous_result, site_name=site_name)
+                        self._notifier_pool.submit(
+                            self._deliver_notification,
+                            notifier,
+                            result,
+                            previous_result,
+                            site_name,
+                        )
             except Exception as e:
                 self.logger.error(
                     f"[{site_name}] Failed to send notification: {e}", exc_info=True
                 )
 
-    def _send_console_notification(self, result: CheckResult, site_name: str):
+    def _deliver_notification(
+        self,
+        notifier: Any,
+        result: CheckResult,
+        previous_result: Optional[CheckResult],
+        site_name: str,
+    ):
+        """Send a single notification (runs on the notifier pool)."""
+        try:
+            notifier.notify(result, previous_result, site_name=site_name)
+        except Exception as e:
+            self.logger.error(
+                f"[{site_name}] Failed to send notification: {e}", exc_info=True
+            )
+
+    @staticmethod
+    def _get_state_change_type(
+        result: CheckResult, previous_success: bool
+    ) -> Optional[str]:
+        """
+        Classify a result against the previous check outcome.
+
+        Args:
+            result: Current check result
+            previous_success: Whether previous check was successful
+
+        Returns:
+            "DOWNTIME", "RECOVERY", or None if the state did not change
+        """
+        if previous_success and result.is_failure:
+            return "DOWNTIME"
+        if not previous_success and result.is_success:
+            return "RECOVERY"
+        return None
+
+    def _send_console_notification(
+        self,
+        result: CheckResult,
+        site_name: str,
+        state_change_type: Optional[str] = None,
+    ):
         """Send notification to console only."""
         for notifier in self.notifiers:
             if isinstance(notifier, ConsoleNotifier):
                 try:
-                    notifier.notify(result, site_name=site_name)
+                    notifier.notify(
+                        result, site_name=site_name, state_change_type=state_change_type
+                    )
                 except Exception as e:
                     self.logger.error(f"Console notification failed: {e}")
                 break
@@ -664,29 +735,35 @@ class Monitor:
             if isinstance(notifier, ConsoleNotifier):
                 continue
 
-            try:
-                # Filter results that this notifier wants to be notified about
-                filtered_results = []
+            self._notifier_pool.submit(
+                self._deliver_batch_notification, notifier, batch_results
+            )
+
+    def _deliver_batch_notification(self, notifier: Any, batch_results: List):
+        """
+        Send batch results to one notifier (runs on the notifier pool).
+
+        Args:
+            notifier: Notifier to deliver to
+            batch_results: List of (result, previous_result, site_name) tuples
+        """
+        try:
+            # Each notifier applies should_notify itself (in notify_batch,
+            # notify_individually and notify), so results are passed unfiltered
+            if hasattr(notifier, "batch_enabled") and notifier.batch_enabled:
+                notifier.notify_batch(batch_results)
+            elif isinstance(notifier, TelegramNotifier):
+                # One message per result, sent concurrently
+                notifier.notify_individually(batch_results)
+            else:
+                # Fall back to individual notifications
                 for result, previous_result, site_name in batch_results:
-                    if notifier.should_notify(result, previous_result):
-                        filtered_results.append((result, previous_result, site_name))
-
-                # Send batch if we have results to notify
-                if filtered_results:
-                    # Check if notifier supports batch notifications
-                    if hasattr(notifier, "batch_enabled") and notifier.batch_enabled:
-                        notifier.notify_batch(filtered_results)
-                    else:
-                        # Fall back to individual notifications
-                        for result, previous_result, site_name in filtered_results:
-                            notifier.notify(
-                                result, previous_result, site_name=site_name
-                            )
-            except Exception as e:
-                self.logger.error(
-                    f"Batch notification failed for {notifier.__class__.__name__}: {e}",
-                    exc_info=True,
-                )
+                    notifier.notify(result, previous_result, site_name=site_name)
+        except Exception as e:
+            self.logger.error(
+                f"Batch notification failed for {notifier.__class__.__name__}: {e}",
+                exc_info=True,
+            )
 
     def _send_startup_notification(self, interval_minutes: int):
         """Send a startup notification to Telegram (if enabled and not in debug mode)."""
@@ -722,13 +799,16 @@ class Monitor:
     def _log_metrics_summary(self):
         """Log metrics summary."""
         metrics_summary = self.metrics_collector.get_all_metrics_summary()
-        availability = metrics_summary.get("availability", {})
+        availability = metrics_summary.get("availability") or {}
+        availability_pct = availability.get("availability_percentage", 0)
+        total_checks = availability.get("total_checks", 0)
+        failed_checks = availability.get("failed_checks", 0)
 
         self.logger.info(
             f"Metrics Summary - "
-            f"Availability: {availability.get('availability_percentage', 0):.2f}%, "
-            f"Total Checks: {availability.get('total_checks', 0)}, "
-            f"Failed: {availability.get('failed_checks', 0)}"
+            f"Availability: {availability_pct:.2f}%, "
+            f"Total Checks: {total_checks}, "
+            f"Failed: {failed_checks}"
         )
 
     def start(self):
@@ -814,6 +894,17 @@ class Monitor:
         if self.scheduler:
             self.scheduler.shutdown()
 
+        # Let queued email/Telegram deliveries finish
+        self.logger.info("Waiting for pending notifications...")
+        self._notifier_pool.shutdown(wait=True)
+
+        # Close notifier connections (e.g. persistent SMTP session)
+        for notifier in self.notifiers:
+            try:
+                notifier.close()
+            except Exception as e:
+                self.logger.error(f"Error closing {notifier.__class__.__name__}: {e}")
+
         # Clean up checkers (if they exist as instance variables)
         # Note: In multi-site architecture, checkers are created per-check-cycle
         # and automatically cleaned up when they go out of scope
@@ -824,8 +915,11 @@ class Monitor:
                 except Exception as e:
                     self.logger.error(f"Error cleaning up checker: {e}")
 
-        # Save final state
-        self.state_manager.save_state()
+        # Write a final state snapshot
+        self.state_manager.close()
+
+        # Send pending healthcheck pings and release the connection
+        self.healthcheck.close()
 
         # Stop sleep prevention (allow computer to sleep again)
         self._stop_sleep_prevention()
@@ -881,6 +975,7 @@ class Monitor:
         # Get metrics summary
         metrics_summary = self.metrics_collector.get_all_metrics_summary()
         state_summary = self.state_manager.get_summary()
+        availability = metrics_summary["availability"]
 
         # Create report content
         report = f"""
@@ -888,24 +983,25 @@ Daily InfoRuta Monitor Report
 {"=" * 40}
 Date: {datetime.now().strftime("%Y-%m-%d")}
 
-Availability: {metrics_summary["availability"]["availability_percentage"]:.2f}%
-Total Checks: {metrics_summary["availability"]["total_checks"]}
-Failed Checks: {metrics_summary["availability"]["failed_checks"]}
-Success Rate: {metrics_summary["availability"]["success_rate"]:.2f}%
+Availability: {availability["availability_percentage"]:.2f}%
+Total Checks: {availability["total_checks"]}
+Failed Checks: {availability["failed_checks"]}
+Success Rate: {availability["success_rate"]:.2f}%
 
 Current Status:
 """
 
-        for check_type, status in state_summary["current_status"].items():
-            report += f"  {check_type}: {status['status']}\n"
+        report += "".join(
+            f"  {site_name} - {check_type}: {status['status']}\n"
+            for site_name, site_summary in state_summary["sites"].items()
+            for check_type, status in site_summary["current_status"].items()
+        )
 
         # Send via email if configured
         for notifier in self.notifiers:
             if isinstance(notifier, EmailNotifier):
                 try:
                     # Create a pseudo check result for the report
-                    from .checkers import CheckResult, CheckStatus
-
                     report_result = CheckResult(
                         check_type="daily_report",
                         timestamp=datetime.now(),
@@ -86,6 +86,18 @@ class BaseNotifier(ABC):
 
         return False
 
+    def close(self) -> None:
+        """Release any resources held by the notifier."""
+        pass
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
     def format_result(self, result: CheckResult) -> str:
         """
         Format a check result for display.
@@ -105,7 +117,7 @@ class BaseNotifier(ABC):
         }.get(result.status.value, "❓")
 
         lines = [
-            f"{status_emoji} {result.check_type.upper()} - {result.status.value.upper()}",
+            f"{status_emoji} {result.check_type_upper} - {result.status_upper}",
             f"Time: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
             f"Response Time: {result.response_time_ms:.0f}ms",
         ]
@@ -2,7 +2,7 @@
 
 import sys
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from colorama import Back, Fore, Style, init
 
@@ -12,10 +12,56 @@ from .base_notifier import BaseNotifier
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+# Precomputed ANSI templates for the colored output path
+_TIMESTAMP_TEMPLATE = f"{Fore.CYAN}[{{ts}}]{Style.RESET_ALL} {{msg}}"
+_SITE_TEMPLATE = f"{Fore.MAGENTA}[{{site}}]{Style.RESET_ALL}"
+_CHECK_TYPE_TEMPLATE = f"{Fore.CYAN}{{}}{Style.RESET_ALL}"
+_STATUS_TEMPLATES = {
+    CheckStatus.SUCCESS: f"{Fore.GREEN}{{}}{Style.RESET_ALL}",
+    CheckStatus.WARNING: f"{Fore.YELLOW}{{}}{Style.RESET_ALL}",
+    CheckStatus.FAILURE: f"{Fore.RED}{{}}{Style.RESET_ALL}",
+    CheckStatus.ERROR: f"{Fore.RED}{Style.BRIGHT}{{}}{Style.RESET_ALL}",
+    CheckStatus.TIMEOUT: f"{Fore.MAGENTA}{{}}{Style.RESET_ALL}",
+}
+_DEFAULT_STATUS_TEMPLATE = f"{Fore.WHITE}{{}}{Style.RESET_ALL}"
+_RESPONSE_TIME_TEMPLATES = {
+    "critical": f"{Fore.RED}{{}}{Style.RESET_ALL}",
+    "warning": f"{Fore.YELLOW}{{}}{Style.RESET_ALL}",
+    "ok": f"{Fore.GREEN}{{}}{Style.RESET_ALL}",
+}
+_STATE_CHANGE_BANNERS = {
+    "DOWNTIME": f"{Back.RED}{Fore.WHITE} ⚠ SITE DOWN ⚠ {Style.RESET_ALL}",
+    "RECOVERY": f"{Back.GREEN}{Fore.WHITE} ✓ SITE RECOVERED ✓ {Style.RESET_ALL}",
+}
+_ERROR_TEMPLATE = f"  {Fore.RED}Error: {{}}{Style.RESET_ALL}"
+_WARNING_TEMPLATE = f"  {Fore.YELLOW}Warning: {{}}{Style.RESET_ALL}"
+
 
 class ConsoleNotifier(BaseNotifier):
     """Display notifications in the console."""
 
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize console notifier.
+
+        Args:
+            config: Configuration dictionary
+        """
+        super().__init__(config)
+
+        # Colors are stripped when output is redirected (log files, systemd
+        # journal), so only build ANSI sequences when stdout is a terminal
+        self._colored = (
+            self.config.get("notifications", {})
+            .get("console", {})
+            .get("colored_output", True)
+        ) and sys.stdout.isatty()
+        self._show_timestamps = (
+            self.config.get("notifications", {})
+            .get("console", {})
+            .get("show_timestamps", True)
+        )
+
     def _is_enabled(self) -> bool:
         """Check if console notifications are enabled."""
         return (
@@ -27,6 +73,7 @@ class ConsoleNotifier(BaseNotifier):
         result: CheckResult,
         previous_result: CheckResult = None,
         site_name: str = None,
+        state_change_type: Optional[str] = None,
     ) -> bool:
         """
         Display notification in console.
@@ -35,6 +82,8 @@ class ConsoleNotifier(BaseNotifier):
             result: Current check result
             previous_result: Previous check result
             site_name: Name of the site being checked
+            state_change_type: "DOWNTIME" or "RECOVERY" if already determined
+                by the caller; derived from previous_result otherwise
 
         Returns:
             True if displayed successfully
@@ -43,31 +92,19 @@ class ConsoleNotifier(BaseNotifier):
             return False
 
         try:
-            # Get configuration
-            show_timestamps = (
-                self.config.get("notifications", {})
-                .get("console", {})
-                .get("show_timestamps", True)
-            )
-            colored_output = (
-                self.config.get("notifications", {})
-                .get("console", {})
-                .get("colored_output", True)
-            )
+            if state_change_type is None and previous_result:
+                if previous_result.is_success and result.is_failure:
+                    state_change_type = "DOWNTIME"
+                elif previous_result.is_failure and result.is_success:
+                    state_change_type = "RECOVERY"
 
             # Build notification message
-            message = self._format_console_message(
-                result, previous_result, colored_output, site_name
+            message = self._add_timestamp(
+                self._format_console_message(
+                    result, state_change_type, self._colored, site_name
+                )
             )
 
-            # Add timestamp if enabled
-            if show_timestamps:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                if colored_output:
-                    message = f"{Fore.CYAN}[{timestamp}]{Style.RESET_ALL} {message}"
-                else:
-                    message = f"[{timestamp}] {message}"
-
             # Print to console
             print(message)
             sys.stdout.flush()
@@ -92,14 +129,19 @@ class ConsoleNotifier(BaseNotifier):
             return False
 
         try:
-            print("\n" + "=" * 60)
-            print("BATCH CHECK RESULTS")
-            print("=" * 60)
-
+            # Format every result directly and write the block once, rather
+            # than going through notify() (and its checks) per result
+            lines = ["", "=" * 60, "BATCH CHECK RESULTS", "=" * 60]
             for result in results:
-                self.notify(result)
+                lines.append(
+                    self._add_timestamp(
+                        self._format_console_message(result, colored=self._colored)
+                    )
+                )
+            lines.append("=" * 60)
+            lines.append("\n")
 
-            print("=" * 60 + "\n")
+            sys.stdout.write("\n".join(lines))
             sys.stdout.flush()
 
             return True
@@ -108,10 +150,28 @@ class ConsoleNotifier(BaseNotifier):
             self.logger.error(f"Failed to display batch console notification: {e}")
             return False
 
+    def _add_timestamp(self, message: str) -> str:
+        """
+        Prefix a formatted message with the current time if enabled.
+
+        Args:
+            message: Formatted message
+
+        Returns:
+            Message with timestamp prefix, or unchanged if timestamps are off
+        """
+        if not self._show_timestamps:
+            return message
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if self._colored:
+            return _TIMESTAMP_TEMPLATE.format(ts=timestamp, msg=message)
+        return f"[{timestamp}] {message}"
+
     def _format_console_message(
         self,
         result: CheckResult,
-        previous_result: CheckResult = None,
+        state_change_type: Optional[str] = None,
         colored: bool = True,
         site_name: str = None,
     ) -> str:
@@ -120,34 +180,24 @@ class ConsoleNotifier(BaseNotifier):
 
         Args:
             result: Check result
-            previous_result: Previous result
+            state_change_type: "DOWNTIME", "RECOVERY" or None
             colored: Use colored output
             site_name: Name of the site
 
         Returns:
             Formatted message string
         """
-        # Determine message type
-        is_state_change = False
-        state_change_type = None
-
-        if previous_result:
-            if previous_result.is_success and result.is_failure:
-                is_state_change = True
-                state_change_type = "DOWNTIME"
-            elif previous_result.is_failure and result.is_success:
-                is_state_change = True
-                state_change_type = "RECOVERY"
+        is_state_change = state_change_type is not None
 
         # Build message components
-        check_type = result.check_type.upper()
-        status = result.status.value.upper()
+        check_type = result.check_type_upper
+        status = result.status_upper
         response_time = f"{result.response_time_ms:.0f}ms"
 
         # Format site name
         if site_name:
             if colored:
-                site_label = f"{Fore.MAGENTA}[{site_name}]{Style.RESET_ALL}"
+                site_label = _SITE_TEMPLATE.format(site=site_name)
             else:
                 site_label = f"[{site_name}]"
         else:
@@ -155,20 +205,11 @@ class ConsoleNotifier(BaseNotifier):
 
         # Apply colors if enabled
         if colored:
-            # Status colors
-            status_colors = {
-                CheckStatus.SUCCESS: Fore.GREEN,
-                CheckStatus.WARNING: Fore.YELLOW,
-                CheckStatus.FAILURE: Fore.RED,
-                CheckStatus.ERROR: Fore.RED + Style.BRIGHT,
-                CheckStatus.TIMEOUT: Fore.MAGENTA,
-            }
-
-            status_color = status_colors.get(result.status, Fore.WHITE)
-
             # Format message parts with colors
-            check_type_formatted = f"{Fore.CYAN}{check_type}{Style.RESET_ALL}"
-            status_formatted = f"{status_color}{status}{Style.RESET_ALL}"
+            check_type_formatted = _CHECK_TYPE_TEMPLATE.format(check_type)
+            status_formatted = _STATUS_TEMPLATES.get(
+                result.status, _DEFAULT_STATUS_TEMPLATE
+            ).format(status)
 
             # Response time coloring based on thresholds
             warning_threshold = self.config.get("performance", {}).get(
@@ -179,30 +220,17 @@ class ConsoleNotifier(BaseNotifier):
             )
 
             if result.response_time_ms > critical_threshold:
-                response_time_formatted = f"{Fore.RED}{response_time}{Style.RESET_ALL}"
+                response_level = "critical"
             elif result.response_time_ms > warning_threshold:
-                response_time_formatted = (
-                    f"{Fore.YELLOW}{response_time}{Style.RESET_ALL}"
-                )
+                response_level = "warning"
             else:
-                response_time_formatted = (
-                    f"{Fore.GREEN}{response_time}{Style.RESET_ALL}"
-                )
+                response_level = "ok"
+            response_time_formatted = _RESPONSE_TIME_TEMPLATES[response_level].format(
+                response_time
+            )
 
             # State change highlighting
-            if is_state_change:
-                if state_change_type == "DOWNTIME":
-                    state_msg = (
-                        f"{Back.RED}{Fore.WHITE} ⚠ SITE DOWN ⚠ {Style.RESET_ALL}"
-                    )
-                elif state_change_type == "RECOVERY":
-                    state_msg = (
-                        f"{Back.GREEN}{Fore.WHITE} ✓ SITE RECOVERED ✓ {Style.RESET_ALL}"
-                    )
-                else:
-                    state_msg = ""
-            else:
-                state_msg = ""
+            state_msg = _STATE_CHANGE_BANNERS.get(state_change_type, "")
 
             # Status icon
             status_icon = {
@@ -248,25 +276,21 @@ class ConsoleNotifier(BaseNotifier):
         if result.status_code:
             message_parts.append(f"HTTP {result.status_code}")
 
-        message = " ".join(message_parts)
+        lines = [" ".join(message_parts)]
 
         # Add error/warning details on separate lines
         if result.error_message:
             if colored:
-                error_line = (
-                    f"  {Fore.RED}Error: {result.error_message}{Style.RESET_ALL}"
-                )
+                error_line = _ERROR_TEMPLATE.format(result.error_message)
             else:
                 error_line = f"  Error: {result.error_message}"
-            message += "\n" + error_line
+            lines.append(error_line)
 
         if result.warning_message:
             if colored:
-                warning_line = (
-                    f"  {Fore.YELLOW}Warning: {result.warning_message}{Style.RESET_ALL}"
-                )
+                warning_line = _WARNING_TEMPLATE.format(result.warning_message)
             else:
                 warning_line = f"  Warning: {result.warning_message}"
-            message += "\n" + warning_line
+            lines.append(warning_line)
 
-        return message
+        return "\n".join(lines)
@@ -1,16 +1,190 @@
 """Email notifier for sending alerts via SMTP."""
 
-import smtplib
+import ssl
+import threading
 from datetime import datetime
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from string import Template
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from ..checkers.base_checker import CheckResult
 from ..storage.credential_manager import CredentialManager
 from ..utils import sanitize_html, sanitize_email_header
 from .base_notifier import BaseNotifier
 
+# smtplib and the email package are only imported once a message is sent,
+# so setups without email notifications never load them
+if TYPE_CHECKING:
+    import smtplib
+    from email.message import EmailMessage
+
+# Email templates, compiled once at import time. Only the $placeholders are
+# filled per notification; all values must be sanitized by the caller.
+_HTML_EMAIL_TMPL = Template(
+    """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+                .header { background-color: $status_color; color: white; padding: 20px; text-align: center; }
+                .content { background-color: #f4f4f4; padding: 20px; margin-top: 10px; }
+                .metrics { background-color: white; padding: 15px; margin-top: 10px; }
+                .footer { text-align: center; margin-top: 20px; color: #666; font-size: 12px; }
+                table { width: 100%; border-collapse: collapse; }
+                th, td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h2>InfoRuta Monitor Alert</h2>
+                    <h3>$check_type - $status</h3>
+                </div>
+
+                <div class="content">
+                    <p><strong>Site:</strong> $site</p>
+                    <p><strong>Check Time:</strong> $timestamp</p>
+                    <p><strong>Response Time:</strong> $response_time</p>
+        $details$metrics
+                </div>
+                <div class="footer">
+                    <p>InfoRuta Website Monitor v1.0.0</p>
+                    <p>This is an automated monitoring alert</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+)
+_HTML_STATUS_CODE_TMPL = Template("<p><strong>HTTP Status:</strong> $status_code</p>")
+_HTML_ERROR_TMPL = Template(
+    """
+                <div style="background-color: #f8d7da; color: #721c24; padding: 10px; margin-top: 10px;">
+                    <strong>Error:</strong> $message
+                </div>
+            """
+)
+_HTML_WARNING_TMPL = Template(
+    """
+                <div style="background-color: #fff3cd; color: #856404; padding: 10px; margin-top: 10px;">
+                    <strong>Warning:</strong> $message
+                </div>
+            """
+)
+_HTML_METRICS_TMPL = Template(
+    """
+                </div>
+                <div class="metrics">
+                    <h4>Performance Metrics</h4>
+                    <table>
+            $rows</table>"""
+)
+_HTML_METRIC_ROW_TMPL = Template("<tr><td>$key</td><td>$value</td></tr>")
+
+_TEXT_EMAIL_TMPL = Template(
+    """
+Multi-Site Monitor Alert
+$rule
+
+Site: $site
+Check Type: $check_type
+Status: $status
+Time: $timestamp
+Response Time: $response_time
+$details
+$rule
+InfoRuta Website Monitor v1.0.0
+This is an automated monitoring alert
+"""
+)
+
+_BATCH_HTML_EMAIL_TMPL = Template(
+    """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                .container { max-width: 800px; margin: 0 auto; padding: 20px; }
+                .summary { background-color: #f8f9fa; padding: 20px; margin-bottom: 20px; }
+                .section { margin-bottom: 30px; }
+                table { width: 100%; border-collapse: collapse; margin-top: 10px; }
+                th { background-color: #343a40; color: white; padding: 10px; text-align: left; }
+                td { padding: 8px; border-bottom: 1px solid #ddd; }
+                .status-success { color: #28a745; }
+                .status-warning { color: #ffc107; }
+                .status-failure { color: #dc3545; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h2>InfoRuta Monitor - Batch Report</h2>
+
+                <div class="summary">
+                    <h3>Summary</h3>
+                    <p>Total Checks: $total</p>
+                    <p class="status-failure">Failures: $failures</p>
+                    <p class="status-warning">Warnings: $warnings</p>
+                    <p class="status-success">Successes: $successes</p>
+                </div>
+        $sections
+            </div>
+        </body>
+        </html>
+        """
+)
+_BATCH_HTML_SECTION_TMPL = Template(
+    """
+                <div class="section">
+                    <h3 class="$status_class">$section_name</h3>
+                    <table>
+                        <tr>
+                            <th>Check Type</th>
+                            <th>Time</th>
+                            <th>Response Time</th>
+                            <th>Details</th>
+                        </tr>
+                $rows</table></div>"""
+)
+_BATCH_HTML_ROW_TMPL = Template(
+    """
+                        <tr>
+                            <td>$check_type</td>
+                            <td>$time</td>
+                            <td>$response_time</td>
+                            <td>$details</td>
+                        </tr>
+                    """
+)
+
+_BATCH_TEXT_EMAIL_TMPL = Template(
+    """
+InfoRuta Monitor - Batch Report
+$rule
+
+Summary:
+- Total Checks: $total
+- Failures: $failures
+- Warnings: $warnings
+- Successes: $successes
+
+$rule
+$sections"""
+)
+
+_TEXT_RULE = "=" * 40
+
+# Header background color per check status value
+_STATUS_COLORS = {
+    "success": "#28a745",
+    "warning": "#ffc107",
+    "failure": "#dc3545",
+    "error": "#dc3545",
+    "timeout": "#6c757d",
+}
+
 
 class EmailNotifier(BaseNotifier):
     """Send notifications via email."""
@@ -30,16 +204,66 @@ class EmailNotifier(BaseNotifier):
         super().__init__(config)
         self.credential_manager = credential_manager or CredentialManager()
         self.email_config = None
+        self._default_site_id = self.config.get("monitoring", {}).get("url", "Site")
+        self._alert_on: Set[str] = set()
+        self._from_header = ""
+        self._to_addresses: List[str] = []
+        self._to_header = ""
+
+        # Persistent SMTP connection, reused across notifications
+        self._smtp: Optional["smtplib.SMTP"] = None
+        self._smtp_lock = threading.Lock()
+        self._msg_count = 0
+        self.max_messages_per_connection = (
+            self.config.get("notifications", {})
+            .get("email", {})
+            .get("max_messages_per_connection", 100)
+        )
+        self.separate_recipients = (
+            self.config.get("notifications", {})
+            .get("email", {})
+            .get("separate_recipients", False)
+        )
+        self.send_html = (
+            self.config.get("notifications", {}).get("email", {}).get("html", True)
+        )
 
         if self.enabled:
             self._setup_email_config()
 
+        # Build the TLS context once and reuse it for every STARTTLS
+        self._ssl_ctx: Optional[ssl.SSLContext] = None
+        if self.enabled and self.email_config.get("use_tls", True):
+            self._ssl_ctx = self._build_ssl_context()
+
     def _is_enabled(self) -> bool:
         """Check if email notifications are enabled."""
         return (
             self.config.get("notifications", {}).get("email", {}).get("enabled", False)
         )
 
+    def _build_ssl_context(self) -> ssl.SSLContext:
+        """
+        Build the TLS context used for STARTTLS.
+
+        By default this matches smtplib's own STARTTLS context, which encrypts
+        but does not verify the server certificate, so relays with
+        self-signed or internal-CA certificates keep working. With
+        ``verify_tls: true`` the certificate and hostname are checked against
+        the system trust store, or against ``ca_file`` when it is set.
+
+        Returns:
+            SSL context for starttls()
+        """
+        email_settings = self.config.get("notifications", {}).get("email", {})
+        if email_settings.get("verify_tls", False):
+            return ssl.create_default_context(cafile=email_settings.get("ca_file"))
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+
     def _setup_email_config(self):
         """Set up email configuration from credentials."""
         self.email_config = self.credential_manager.get_email_credentials()
@@ -53,6 +277,7 @@ class EmailNotifier(BaseNotifier):
             "smtp_port", self.email_config.get("smtp_port")
         )
         self.email_config["use_tls"] = email_settings.get("use_tls", True)
+        self._alert_on = set(email_settings.get("alert_on", []))
 
         # Get recipient list
         to_addresses = email_settings.get("to_addresses", [])
@@ -76,6 +301,14 @@ class EmailNotifier(BaseNotifier):
                 "Email configuration incomplete, notifications disabled"
             )
             self.enabled = False
+            return
+
+        # Sanitize the fixed headers once (prevents header injection)
+        self._from_header = sanitize_email_header(self.email_config["from_address"])
+        self._to_addresses = [
+            sanitize_email_header(addr) for addr in self.email_config["to_addresses"]
+        ]
+        self._to_header = ", ".join(self._to_addresses)
 
     def notify(
         self,
@@ -104,19 +337,18 @@ class EmailNotifier(BaseNotifier):
             )
 
             # Check if we should send this type of alert
-            alert_on = (
-                self.config.get("notifications", {})
-                .get("email", {})
-                .get("alert_on", [])
-            )
-            if alert_on and email_type not in alert_on:
+            if self._alert_on and email_type not in self._alert_on:
                 self.logger.debug(
                     f"Email type '{email_type}' not in alert_on list, skipping"
                 )
                 return False
 
-            # Create email content
-            html_content = self._create_html_email(result, previous_result, site_name)
+            # Create email content (HTML part only if enabled)
+            html_content = (
+                self._create_html_email(result, previous_result, site_name)
+                if self.send_html
+                else None
+            )
             text_content = self._create_text_email(result, previous_result, site_name)
 
             # Send email
@@ -141,17 +373,21 @@ class EmailNotifier(BaseNotifier):
 
         try:
             # Create summary
-            failures = [r for r in results if r.is_failure]
-            warnings = [r for r in results if r.is_warning]
-            successes = [r for r in results if r.is_success]
+            failures, warnings, successes = self._partition_results(results)
 
             subject = (
                 f"InfoRuta Monitor: {len(failures)} failures, {len(warnings)} warnings"
             )
 
             # Create batch email content
-            html_content = self._create_batch_html_email(results)
-            text_content = self._create_batch_text_email(results)
+            html_content = (
+                self._create_batch_html_email(results, failures, warnings, successes)
+                if self.send_html
+                else None
+            )
+            text_content = self._create_batch_text_email(
+                results, failures, warnings, successes
+            )
 
             return self._send_email(subject, html_content, text_content)
 
@@ -166,9 +402,7 @@ class EmailNotifier(BaseNotifier):
         site_name: str = None,
     ) -> tuple:
         """Get email subject and type based on results."""
-        site_identifier = site_name or self.config.get("monitoring", {}).get(
-            "url", "Site"
-        )
+        site_identifier = site_name or self._default_site_id
 
         # Detect state changes
         if previous_result:
@@ -198,103 +432,60 @@ class EmailNotifier(BaseNotifier):
         site_name: str = None,
     ) -> str:
         """Create HTML email content."""
-        site_identifier = site_name or self.config.get("monitoring", {}).get(
-            "url", "Site"
-        )
-
-        # Sanitize all user-controlled data for HTML
-        safe_site = sanitize_html(site_identifier)
-        safe_check_type = sanitize_html(result.check_type.upper())
-        safe_status = sanitize_html(result.status.value.upper())
+        site_identifier = site_name or self._default_site_id
 
         # Determine status color
-        status_color = {
-            "success": "#28a745",
-            "warning": "#ffc107",
-            "failure": "#dc3545",
-            "error": "#dc3545",
-            "timeout": "#6c757d",
-        }.get(result.status.value, "#6c757d")
-
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background-color: {status_color}; color: white; padding: 20px; text-align: center; }}
-                .content {{ background-color: #f4f4f4; padding: 20px; margin-top: 10px; }}
-                .metrics {{ background-color: white; padding: 15px; margin-top: 10px; }}
-                .footer {{ text-align: center; margin-top: 20px; color: #666; font-size: 12px; }}
-                table {{ width: 100%; border-collapse: collapse; }}
-                th, td {{ padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2>InfoRuta Monitor Alert</h2>
-                    <h3>{safe_check_type} - {safe_status}</h3>
-                </div>
-
-                <div class="content">
-                    <p><strong>Site:</strong> {safe_site}</p>
-                    <p><strong>Check Time:</strong> {result.timestamp.strftime("%Y-%m-%d %H:%M:%S")}</p>
-                    <p><strong>Response Time:</strong> {result.response_time_ms:.0f}ms</p>
-        """
+        status_color = _STATUS_COLORS.get(result.status.value, "#6c757d")
 
+        # Sanitize all user-controlled data for HTML
+        details = []
         if result.status_code:
-            html += f"<p><strong>HTTP Status:</strong> {result.status_code}</p>"
-
+            details.append(
+                _HTML_STATUS_CODE_TMPL.substitute(status_code=result.status_code)
+            )
         if result.error_message:
-            safe_error = sanitize_html(result.error_message)
-            html += f"""
-                <div style="background-color: #f8d7da; color: #721c24; padding: 10px; margin-top: 10px;">
-                    <strong>Error:</strong> {safe_error}
-                </div>
-            """
-
+            details.append(
+                _HTML_ERROR_TMPL.substitute(
+                    message=sanitize_html(result.error_message)
+                )
+            )
         if result.warning_message:
-            safe_warning = sanitize_html(result.warning_message)
-            html += f"""
-                <div style="background-color: #fff3cd; color: #856404; padding: 10px; margin-top: 10px;">
-                    <strong>Warning:</strong> {safe_warning}
-                </div>
-            """
+            details.append(
+                _HTML_WARNING_TMPL.substitute(
+                    message=sanitize_html(result.warning_message)
+                )
+            )
 
         # Add metrics if available
+        metrics = ""
         if result.metrics:
-            html += """
-                </div>
-                <div class="metrics">
-                    <h4>Performance Metrics</h4>
-                    <table>
-            """
-            for key, value in result.metrics.items():
-                safe_key = sanitize_html(str(key))
-                if isinstance(value, dict):
-                    for sub_key, sub_value in value.items():
-                        safe_sub_key = sanitize_html(str(sub_key))
-                        safe_sub_value = sanitize_html(str(sub_value))
-                        html += f"<tr><td>{safe_key}.{safe_sub_key}</td><td>{safe_sub_value}</td></tr>"
-                else:
-                    safe_value = sanitize_html(str(value))
-                    html += f"<tr><td>{safe_key}</td><td>{safe_value}</td></tr>"
-            html += "</table>"
-
-        html += f"""
-                </div>
-                <div class="footer">
-                    <p>InfoRuta Website Monitor v1.0.0</p>
-                    <p>This is an automated monitoring alert</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        return html
+            # Flatten nested metric dicts to "key.sub_key" rows
+            pairs = chain.from_iterable(
+                (
+                    ((f"{key}.{sub}", sub_value) for sub, sub_value in value.items())
+                    if isinstance(value, dict)
+                    else ((key, value),)
+                )
+                for key, value in result.metrics.items()
+            )
+            rows = "".join(
+                _HTML_METRIC_ROW_TMPL.substitute(
+                    key=sanitize_html(str(key)), value=sanitize_html(str(value))
+                )
+                for key, value in pairs
+            )
+            metrics = _HTML_METRICS_TMPL.substitute(rows=rows)
+
+        return _HTML_EMAIL_TMPL.substitute(
+            status_color=status_color,
+            check_type=sanitize_html(result.check_type_upper),
+            status=sanitize_html(result.status_upper),
+            site=sanitize_html(site_identifier),
+            timestamp=result.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            response_time=f"{result.response_time_ms:.0f}ms",
+            details="".join(details),
+            metrics=metrics,
+        )
 
     def _create_text_email(
         self,
@@ -303,157 +494,133 @@ class EmailNotifier(BaseNotifier):
         site_name: str = None,
     ) -> str:
         """Create plain text email content."""
-        site_identifier = site_name or self.config.get("monitoring", {}).get(
-            "url", "Site"
-        )
-
-        text = f"""
-Multi-Site Monitor Alert
-{"=" * 40}
-
-Site: {site_identifier}
-Check Type: {result.check_type.upper()}
-Status: {result.status.value.upper()}
-Time: {result.timestamp.strftime("%Y-%m-%d %H:%M:%S")}
-Response Time: {result.response_time_ms:.0f}ms
-"""
+        site_identifier = site_name or self._default_site_id
 
+        details = []
         if result.status_code:
-            text += f"HTTP Status: {result.status_code}\n"
-
+            details.append(f"HTTP Status: {result.status_code}\n")
         if result.error_message:
-            text += f"\nError: {result.error_message}\n"
-
+            details.append(f"\nError: {result.error_message}\n")
         if result.warning_message:
-            text += f"\nWarning: {result.warning_message}\n"
-
-        text += f"""
-{"=" * 40}
-InfoRuta Website Monitor v1.0.0
-This is an automated monitoring alert
-"""
-
-        return text
+            details.append(f"\nWarning: {result.warning_message}\n")
+
+        return _TEXT_EMAIL_TMPL.substitute(
+            rule=_TEXT_RULE,
+            site=site_identifier,
+            check_type=result.check_type_upper,
+            status=result.status_upper,
+            timestamp=result.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            response_time=f"{result.response_time_ms:.0f}ms",
+            details="".join(details),
+        )
 
-    def _create_batch_html_email(self, results: List[CheckResult]) -> str:
-        """Create HTML email for batch results."""
-        # Group results by status
-        failures = [r for r in results if r.is_failure]
-        warnings = [r for r in results if r.is_warning]
-        successes = [r for r in results if r.is_success]
+    @staticmethod
+    def _partition_results(
+        results: List[CheckResult],
+    ) -> Tuple[List[CheckResult], List[CheckResult], List[CheckResult]]:
+        """
+        Split results into failures, warnings and successes in one pass.
 
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
-                .container { max-width: 800px; margin: 0 auto; padding: 20px; }
-                .summary { background-color: #f8f9fa; padding: 20px; margin-bottom: 20px; }
-                .section { margin-bottom: 30px; }
-                table { width: 100%; border-collapse: collapse; margin-top: 10px; }
-                th { background-color: #343a40; color: white; padding: 10px; text-align: left; }
-                td { padding: 8px; border-bottom: 1px solid #ddd; }
-                .status-success { color: #28a745; }
-                .status-warning { color: #ffc107; }
-                .status-failure { color: #dc3545; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h2>InfoRuta Monitor - Batch Report</h2>
+        Args:
+            results: List of check results
 
-                <div class="summary">
-                    <h3>Summary</h3>
-                    <p>Total Checks: {}</p>
-                    <p class="status-failure">Failures: {}</p>
-                    <p class="status-warning">Warnings: {}</p>
-                    <p class="status-success">Successes: {}</p>
-                </div>
-        """.format(len(results), len(failures), len(warnings), len(successes))
+        Returns:
+            Tuple of (failures, warnings, successes)
+        """
+        failures, warnings, successes = [], [], []
+        for r in results:
+            if r.is_failure:
+                failures.append(r)
+            elif r.is_warning:
+                warnings.append(r)
+            else:
+                successes.append(r)
+        return failures, warnings, successes
 
+    def _create_batch_html_email(
+        self,
+        results: List[CheckResult],
+        failures: List[CheckResult],
+        warnings: List[CheckResult],
+        successes: List[CheckResult],
+    ) -> str:
+        """Create HTML email for batch results, already grouped by status."""
         # Add sections for each status type
+        sections = []
         for section_name, section_results, status_class in [
             ("Failures", failures, "status-failure"),
             ("Warnings", warnings, "status-warning"),
             ("Successes", successes, "status-success"),
         ]:
             if section_results:
-                html += f"""
-                <div class="section">
-                    <h3 class="{status_class}">{section_name}</h3>
-                    <table>
-                        <tr>
-                            <th>Check Type</th>
-                            <th>Time</th>
-                            <th>Response Time</th>
-                            <th>Details</th>
-                        </tr>
-                """
-
-                for result in section_results:
-                    details = result.error_message or result.warning_message or "OK"
-                    # Sanitize all user-controlled data
-                    safe_check_type = sanitize_html(result.check_type)
-                    safe_details = sanitize_html(details)
-                    html += f"""
-                        <tr>
-                            <td>{safe_check_type}</td>
-                            <td>{result.timestamp.strftime("%H:%M:%S")}</td>
-                            <td>{result.response_time_ms:.0f}ms</td>
-                            <td>{safe_details}</td>
-                        </tr>
-                    """
-
-                html += "</table></div>"
-
-        html += """
-            </div>
-        </body>
-        </html>
-        """
-
-        return html
-
-    def _create_batch_text_email(self, results: List[CheckResult]) -> str:
-        """Create text email for batch results."""
-        failures = [r for r in results if r.is_failure]
-        warnings = [r for r in results if r.is_warning]
-        successes = [r for r in results if r.is_success]
-
-        text = f"""
-InfoRuta Monitor - Batch Report
-{"=" * 40}
-
-Summary:
-- Total Checks: {len(results)}
-- Failures: {len(failures)}
-- Warnings: {len(warnings)}
-- Successes: {len(successes)}
+                # Sanitize all user-controlled data
+                rows = "".join(
+                    _BATCH_HTML_ROW_TMPL.substitute(
+                        check_type=sanitize_html(result.check_type),
+                        time=result.timestamp.strftime("%H:%M:%S"),
+                        response_time=f"{result.response_time_ms:.0f}ms",
+                        details=sanitize_html(
+                            result.error_message or result.warning_message or "OK"
+                        ),
+                    )
+                    for result in section_results
+                )
+                sections.append(
+                    _BATCH_HTML_SECTION_TMPL.substitute(
+                        status_class=status_class,
+                        section_name=section_name,
+                        rows=rows,
+                    )
+                )
 
-{"=" * 40}
-"""
+        return _BATCH_HTML_EMAIL_TMPL.substitute(
+            total=len(results),
+            failures=len(failures),
+            warnings=len(warnings),
+            successes=len(successes),
+            sections="".join(sections),
+        )
 
+    def _create_batch_text_email(
+        self,
+        results: List[CheckResult],
+        failures: List[CheckResult],
+        warnings: List[CheckResult],
+        successes: List[CheckResult],
+    ) -> str:
+        """Create text email for batch results, already grouped by status."""
+        sections = []
         for section_name, section_results in [
             ("FAILURES", failures),
             ("WARNINGS", warnings),
             ("SUCCESSES", successes),
         ]:
             if section_results:
-                text += f"\n{section_name}:\n"
+                sections.append(f"\n{section_name}:\n")
                 for result in section_results:
                     details = result.error_message or result.warning_message or "OK"
-                    text += f"  - {result.check_type}: {details} ({result.response_time_ms:.0f}ms)\n"
-
-        return text
+                    sections.append(
+                        f"  - {result.check_type}: {details} ({result.response_time_ms:.0f}ms)\n"
+                    )
+
+        return _BATCH_TEXT_EMAIL_TMPL.substitute(
+            rule=_TEXT_RULE,
+            total=len(results),
+            failures=len(failures),
+            warnings=len(warnings),
+            successes=len(successes),
+            sections="".join(sections),
+        )
 
-    def _send_email(self, subject: str, html_content: str, text_content: str) -> bool:
+    def _send_email(
+        self, subject: str, html_content: Optional[str], text_content: str
+    ) -> bool:
         """
         Send email via SMTP.
 
         Args:
             subject: Email subject
-            html_content: HTML email body
+            html_content: HTML email body, or None for a text-only email
             text_content: Plain text email body
 
         Returns:
@@ -462,33 +629,19 @@ Summary:
         try:
             # Sanitize email headers to prevent header injection
             safe_subject = sanitize_email_header(subject)
-            safe_from = sanitize_email_header(self.email_config["from_address"])
-            safe_to_addresses = [
-                sanitize_email_header(addr) for addr in self.email_config["to_addresses"]
-            ]
-
-            # Create message
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = safe_subject
-            msg["From"] = safe_from
-            msg["To"] = ", ".join(safe_to_addresses)
 
-            # Attach parts
-            text_part = MIMEText(text_content, "plain")
-            html_part = MIMEText(html_content, "html")
-            msg.attach(text_part)
-            msg.attach(html_part)
+            # One message per recipient keeps addresses private; either way
+            # everything goes out over a single SMTP session
+            if self.separate_recipients:
+                to_headers = self._to_addresses
+            else:
+                to_headers = [self._to_header]
+            messages = [
+                self._build_message(safe_subject, html_content, text_content, to)
+                for to in to_headers
+            ]
 
-            # Send email
-            with smtplib.SMTP(
-                self.email_config["smtp_server"], self.email_config["smtp_port"]
-            ) as server:
-                if self.email_config.get("use_tls", True):
-                    server.starttls()
-                server.login(
-                    self.email_config["from_address"], self.email_config["password"]
-                )
-                server.send_message(msg)
+            self._send_many(messages)
 
             self.logger.info(f"Email sent successfully: {subject}")
             return True
@@ -496,3 +649,128 @@ Summary:
         except Exception as e:
             self.logger.error(f"Failed to send email: {e}")
             return False
+
+    def _build_message(
+        self,
+        subject: str,
+        html_content: Optional[str],
+        text_content: str,
+        to_header: str,
+    ) -> "EmailMessage":
+        """
+        Build an email message, multipart/alternative when HTML is given.
+
+        Args:
+            subject: Sanitized email subject
+            html_content: HTML email body, or None for a text-only email
+            text_content: Plain text email body
+            to_header: Sanitized To header value
+
+        Returns:
+            Message ready to send
+        """
+        from email.message import EmailMessage
+
+        msg = EmailMessage()
+        msg["Subject"] = subject
+        msg["From"] = self._from_header
+        msg["To"] = to_header
+        msg.set_content(text_content)
+        if html_content is not None:
+            msg.add_alternative(html_content, subtype="html")
+        return msg
+
+    def _send_many(self, messages: List["EmailMessage"]) -> None:
+        """
+        Send several messages in one SMTP session.
+
+        The envelope is reset with RSET between messages. Servers that drop
+        the session on RSET are reconnected before the next message.
+
+        Args:
+            messages: Messages to send
+
+        Raises:
+            smtplib.SMTPException: If a message could not be sent
+        """
+        import smtplib
+
+        # Send over the shared connection (SMTP is sequential)
+        with self._smtp_lock:
+            server = self._get_smtp()
+            for i, msg in enumerate(messages):
+                if i:
+                    try:
+                        server.rset()
+                    except smtplib.SMTPException:
+                        self._close_smtp()
+                        server = self._get_smtp()
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPException:
+                    # Connection was closed or reset by the server - drop it
+                    # so the next notification reconnects
+                    self._close_smtp()
+                    raise
+                self._msg_count += 1
+
+    def _get_smtp(self) -> "smtplib.SMTP":
+        """
+        Get a connected and authenticated SMTP session.
+
+        Reuses the existing connection while it answers NOOP and has not
+        reached max_messages_per_connection; otherwise reconnects.
+        Must be called with _smtp_lock held.
+
+        Returns:
+            SMTP session ready to send
+        """
+        import smtplib
+
+        if self._smtp is not None:
+            if self._msg_count >= self.max_messages_per_connection:
+                self._close_smtp()
+            else:
+                try:
+                    if self._smtp.noop()[0] == 250:
+                        return self._smtp
+                except smtplib.SMTPException:
+                    pass
+                self._close_smtp()
+
+        server = smtplib.SMTP(
+            self.email_config["smtp_server"], self.email_config["smtp_port"]
+        )
+        try:
+            if self.email_config.get("use_tls", True):
+                server.starttls(context=self._ssl_ctx)
+            server.login(
+                self.email_config["from_address"], self.email_config["password"]
+            )
+        except Exception:
+            server.close()
+            raise
+
+        self._smtp = server
+        self._msg_count = 0
+        self.logger.debug("Opened SMTP connection")
+        return server
+
+    def _close_smtp(self):
+        """Close the SMTP session, if any. Must be called with _smtp_lock held."""
+        if self._smtp is None:
+            return
+
+        try:
+            self._smtp.quit()
+        except Exception:
+            # Server already dropped the connection - just release the socket
+            self._smtp.close()
+        finally:
+            self._smtp = None
+            self._msg_count = 0
+
+    def close(self):
+        """Close the persistent SMTP connection."""
+        with self._smtp_lock:
+            self._close_smtp()
@@ -8,14 +8,35 @@ Sends check results via Telegram Bot API with support for:
 - Batch notifications
 """
 
+import asyncio
+import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import httpx
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..checkers import CheckResult, CheckStatus
 from .base_notifier import BaseNotifier
 
+# Appended to single-result messages in debug mode
+_DEBUG_FOOTER = "\n\n_\\[Debug Mode\\]_"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
 
 class TelegramNotifier(BaseNotifier):
     """
@@ -39,6 +60,9 @@ class TelegramNotifier(BaseNotifier):
 
     TELEGRAM_API_BASE = "https://api.telegram.org/bot"
 
+    # Translation table for MarkdownV2 escaping, applied in a single pass
+    _MD_ESCAPE = str.maketrans({c: "\\" + c for c in "_*[]()~`>#+-=|{}.!"})
+
     def __init__(self, config: Dict[str, Any], credential_manager=None):
         """Initialize Telegram notifier."""
         # Set config attributes BEFORE calling super().__init__()
@@ -58,14 +82,37 @@ class TelegramNotifier(BaseNotifier):
                 "alert_on", ["downtime", "recovery", "auth_failure"]
             )
         )
+        self._emoji_map = {
+            CheckStatus.SUCCESS: "✅",
+            CheckStatus.WARNING: "⚠️",
+            CheckStatus.FAILURE: "❌",
+            CheckStatus.ERROR: "❌",
+            CheckStatus.TIMEOUT: "⏰",
+        }
 
         # Get credentials
         telegram_creds = self.credential_manager.get_telegram_credentials()
         self.bot_token = telegram_creds.get("bot_token")
         self.chat_id = telegram_creds.get("chat_id")
 
-        # Note: No longer keeping a persistent HTTP client to avoid resource leaks
-        # Each API call will create and properly close its own client
+        self._send_url = f"{self.TELEGRAM_API_BASE}{self.bot_token}/sendMessage"
+
+        # sendMessage body is constant apart from the text; the rest is
+        # serialized once, on first send (see _build_payload)
+        self._payload_prefix: Optional[bytes] = None
+
+        # Persistent HTTP client so back-to-back alerts reuse the TLS session
+        # to api.telegram.org; released by close() when the monitor stops
+        self.http_client = httpx.Client(
+            timeout=10.0,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=2,  # Retry transient connection failures
+                limits=httpx.Limits(
+                    max_keepalive_connections=4, keepalive_expiry=60.0
+                ),
+            ),
+        )
 
         # Validation
         if self.enabled and (not self.bot_token or not self.chat_id):
@@ -154,6 +201,59 @@ class TelegramNotifier(BaseNotifier):
         message = self._format_batch_message(filtered_results)
         return self._send_telegram_message(message)
 
+    def notify_individually(self, results: List[tuple]) -> bool:
+        """
+        Send one message per check result, concurrently.
+
+        Used when batch notifications are disabled. Must not be called from a
+        running event loop (it runs its own via asyncio.run).
+
+        Args:
+            results: List of (CheckResult, previous_result, site_name) tuples
+
+        Returns:
+            bool: True if every message was sent successfully
+        """
+        if not self.enabled or not results:
+            return False
+
+        return asyncio.run(self.notify_batch_async(results))
+
+    async def notify_batch_async(self, results: List[tuple]) -> bool:
+        """
+        Send one message per check result with concurrent API requests.
+
+        Total latency is bounded by the slowest request rather than the sum.
+
+        Args:
+            results: List of (CheckResult, previous_result, site_name) tuples
+
+        Returns:
+            bool: True if every message was sent successfully
+        """
+        messages = [
+            self._format_message(result, prev, site)
+            for result, prev, site in results
+            if self.should_notify(result, prev)
+        ]
+        if not messages:
+            return False
+
+        # Async connections are bound to the event loop, so the client lives
+        # for this call only
+        async with httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        ) as client:
+            sent = await asyncio.gather(
+                *(
+                    self._send_telegram_message_async(client, message)
+                    for message in messages
+                )
+            )
+        return all(sent)
+
     def _format_message(
         self,
         result: CheckResult,
@@ -182,51 +282,38 @@ class TelegramNotifier(BaseNotifier):
             elif result.status in [CheckStatus.FAILURE, CheckStatus.ERROR]:
                 state_change = " 🚨 NEW FAILURE"
 
-        # Check type
-        check_type = result.check_type.upper()
-
-        # Status text
-        status_text = result.status.name
-
-        # Build message
-        lines = [
-            f"{emoji} *\\[{self._escape_markdown(site_name)}\\]* {check_type} {status_text}{state_change}",
-            "",
-        ]
-
-        # Add response time and details
-        if result.response_time_ms:
-            lines.append(f"⏱ Response: `{result.response_time_ms}ms`")
-
-        # Add HTTP status for uptime checks
-        if result.check_type == "uptime" and result.status_code:
-            lines.append(f"📊 HTTP: `{result.status_code}`")
-
-        # Add warning message if present
-        if result.warning_message:
-            lines.append(f"💬 {self._escape_markdown(result.warning_message)}")
-
-        # Add error details for failures
-        if result.status in [
-            CheckStatus.FAILURE,
-            CheckStatus.ERROR,
-            CheckStatus.TIMEOUT,
-        ]:
-            if result.error_message:
-                lines.append(
-                    f"❗️ Error: `{self._escape_markdown(result.error_message)}`"
-                )
-
-        # Timestamp
+        # Optional detail lines, each ending in a newline (or empty)
+        response_line = (
+            f"⏱ Response: `{result.response_time_ms}ms`\n"
+            if result.response_time_ms
+            else ""
+        )
+        http_line = (
+            f"📊 HTTP: `{result.status_code}`\n"
+            if result.check_type == "uptime" and result.status_code
+            else ""
+        )
+        warning_line = (
+            f"💬 {self._escape_markdown(result.warning_message)}\n"
+            if result.warning_message
+            else ""
+        )
+        error_line = (
+            f"❗️ Error: `{self._escape_markdown(result.error_message)}`\n"
+            if result.error_message and result.is_failure
+            else ""
+        )
         timestamp = result.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        lines.append(f"🕐 Time: `{timestamp}`")
 
-        # Debug mode indicator
-        if self.debug_mode:
-            lines.append("")
-            lines.append("_\\[Debug Mode\\]_")
-
-        return "\n".join(lines)
+        # Build message
+        return (
+            f"{emoji} *\\[{self._escape_markdown(site_name)}\\]* "
+            f"{result.check_type_upper} {result.status.name}{state_change}\n"
+            "\n"
+            f"{response_line}{http_line}{warning_line}{error_line}"
+            f"🕐 Time: `{timestamp}`"
+            f"{_DEBUG_FOOTER if self.debug_mode else ''}"
+        )
 
     def _format_batch_message(self, results: List[tuple]) -> str:
         """
@@ -261,8 +348,13 @@ class TelegramNotifier(BaseNotifier):
         lines.append(" \\| ".join(summary_parts))
         lines.append("")
 
-        # Individual results (condensed)
+        # Individual results (condensed); results of the same site share
+        # one escaped name
+        escaped_sites: Dict[str, str] = {}
         for result, prev, site_name in results:
+            site_esc = escaped_sites.get(site_name)
+            if site_esc is None:
+                site_esc = escaped_sites[site_name] = self._escape_markdown(site_name)
             emoji = self._get_status_emoji(result.status)
             check_type = result.check_type.upper()[:4]  # Shortened
             response = (
@@ -271,7 +363,7 @@ class TelegramNotifier(BaseNotifier):
                 else "N/A"
             )
 
-            line = f"{emoji} `{self._escape_markdown(site_name)[:15]:15s}` {check_type} `{response}`"
+            line = f"{emoji} `{site_esc[:15]:15s}` {check_type} `{response}`"
             lines.append(line)
 
         # Timestamp
@@ -283,14 +375,7 @@ class TelegramNotifier(BaseNotifier):
 
     def _get_status_emoji(self, status: CheckStatus) -> str:
         """Get emoji for check status."""
-        emoji_map = {
-            CheckStatus.SUCCESS: "✅",
-            CheckStatus.WARNING: "⚠️",
-            CheckStatus.FAILURE: "❌",
-            CheckStatus.ERROR: "❌",
-            CheckStatus.TIMEOUT: "⏰",
-        }
-        return emoji_map.get(status, "❓")
+        return self._emoji_map.get(status, "❓")
 
     def _escape_markdown(self, text: str) -> str:
         """
@@ -301,39 +386,14 @@ class TelegramNotifier(BaseNotifier):
         if not text:
             return ""
 
-        special_chars = [
-            "_",
-            "*",
-            "[",
-            "]",
-            "(",
-            ")",
-            "~",
-            "`",
-            ">",
-            "#",
-            "+",
-            "-",
-            "=",
-            "|",
-            "{",
-            "}",
-            ".",
-            "!",
-        ]
-
-        escaped = str(text)
-        for char in special_chars:
-            escaped = escaped.replace(char, f"\\{char}")
-
-        return escaped
+        return str(text).translate(self._MD_ESCAPE)
 
     def _send_telegram_message(self, message: str) -> bool:
         """
         Send message via Telegram Bot API.
 
-        Uses a fresh HTTP client for each request with proper resource cleanup
-        to prevent connection leaks and file descriptor accumulation.
+        Uses the notifier's pooled HTTP client; connections are kept alive
+        between messages and released by close().
 
         Args:
             message: Formatted message to send
@@ -341,39 +401,121 @@ class TelegramNotifier(BaseNotifier):
         Returns:
             bool: True if sent successfully
         """
+        body = self._prepare_send(message)
+        if body is None:
+            return False
+
+        try:
+            response = self.http_client.post(
+                self._send_url, content=body, headers=_JSON_HEADERS
+            )
+            return self._handle_response(response)
+        except Exception as e:
+            return self._handle_send_error(e)
+
+    def _prepare_send(self, message: str) -> Optional[bytes]:
+        """
+        Check credentials and build the request body for a message.
+
+        Args:
+            message: Formatted message to send
+
+        Returns:
+            Serialized request body, or None if credentials are missing
+        """
         if not self.bot_token or not self.chat_id:
             self.logger.error("Cannot send Telegram message: missing credentials")
-            return False
+            return None
+        return self._build_payload(message)
 
-        url = f"{self.TELEGRAM_API_BASE}{self.bot_token}/sendMessage"
+    def _handle_response(self, response: httpx.Response) -> bool:
+        """
+        Check a sendMessage response.
 
-        payload = {"chat_id": self.chat_id, "text": message, "parse_mode": "MarkdownV2"}
+        Args:
+            response: Response from the Telegram Bot API
 
-        # Use context manager to ensure HTTP client is properly closed
-        # This prevents resource leaks that accumulate over long-running sessions
-        try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
-
-                result = response.json()
-                if result.get("ok"):
-                    self.logger.debug("Telegram message sent successfully")
-                    return True
-                else:
-                    self.logger.error(
-                        f"Telegram API error: {result.get('description')}"
-                    )
-                    return False
-
-        except httpx.HTTPStatusError as e:
+        Returns:
+            bool: True if Telegram accepted the message
+
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status
+        """
+        response.raise_for_status()
+
+        result = response.json()
+        if result.get("ok"):
+            self.logger.debug("Telegram message sent successfully")
+            return True
+        self.logger.error(f"Telegram API error: {result.get('description')}")
+        return False
+
+    def _handle_send_error(self, error: Exception) -> bool:
+        """
+        Log an error raised while sending a message.
+
+        Args:
+            error: Exception raised by the request or response handling
+
+        Returns:
+            bool: Always False
+        """
+        if isinstance(error, httpx.HTTPStatusError):
             self.logger.error(
-                f"Telegram HTTP error: {e.response.status_code} - {e.response.text}"
+                f"Telegram HTTP error: {error.response.status_code} - "
+                f"{error.response.text}"
             )
+        elif isinstance(error, httpx.RequestError):
+            self.logger.error(f"Telegram request error: {str(error)}")
+        else:
+            self.logger.error(
+                f"Unexpected error sending Telegram message: {str(error)}"
+            )
+        return False
+
+    def _build_payload(self, message: str) -> bytes:
+        """
+        Build the JSON body for a sendMessage request.
+
+        Args:
+            message: Formatted message text
+
+        Returns:
+            bytes: Serialized request body
+        """
+        if self._payload_prefix is None:
+            # {"chat_id": ..., "parse_mode": ..., "text": <message>}
+            self._payload_prefix = (
+                _json_bytes({"chat_id": self.chat_id, "parse_mode": "MarkdownV2"})[:-1]
+                + b',"text":'
+            )
+        return self._payload_prefix + _json_bytes(message) + b"}"
+
+    async def _send_telegram_message_async(
+        self, client: httpx.AsyncClient, message: str
+    ) -> bool:
+        """
+        Send message via Telegram Bot API using an async client.
+
+        Args:
+            client: Async HTTP client to send with
+            message: Formatted message to send
+
+        Returns:
+            bool: True if sent successfully
+        """
+        body = self._prepare_send(message)
+        if body is None:
             return False
-        except httpx.RequestError as e:
-            self.logger.error(f"Telegram request error: {str(e)}")
-            return False
+
+        try:
+            response = await client.post(
+                self._send_url, content=body, headers=_JSON_HEADERS
+            )
+            return self._handle_response(response)
         except Exception as e:
-            self.logger.error(f"Unexpected error sending Telegram message: {str(e)}")
-            return False
+            return self._handle_send_error(e)
+
+    def close(self) -> None:
+        """Close the pooled HTTP client."""
+        self.http_client.close()
@@ -1,15 +1,43 @@
 """Scheduler for periodic monitoring checks using APScheduler."""
 
+import asyncio
+import functools
+import heapq
 import logging
+import os
+import threading
 from typing import Dict, Any, List, Callable, Optional
 from datetime import datetime, timedelta
+from weakref import WeakValueDictionary
 
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
-from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
+from apscheduler.events import (
+    EVENT_JOB_ADDED,
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MODIFIED,
+    EVENT_JOB_REMOVED,
+)
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.executors.base import MaxInstancesReachedError
 from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.job import Job
+from apscheduler.jobstores.memory import MemoryJobStore
+
+
+# Cron triggers are never mutated after creation and have no creation-time
+# anchor, so jobs on the same schedule share one instance. Interval triggers
+# anchor on their start date and are built per job.
+@functools.lru_cache(maxsize=64)
+def _cron_trigger(
+    hour: Optional[int], minute: Optional[int], day_of_week: Optional[str]
+) -> CronTrigger:
+    """Get the shared cron trigger for a schedule."""
+    return CronTrigger(hour=hour, minute=minute, day_of_week=day_of_week)
 
 
 class MonitorScheduler:
@@ -25,10 +53,21 @@ class MonitorScheduler:
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.jobs = {}
-
-        # Configure executors
-        executors = {"default": ThreadPoolExecutor(max_workers=5)}
+        # Jobs are owned by the scheduler's jobstore; entries vanish once a
+        # job is removed or replaced there and nothing else references it
+        self.jobs: "WeakValueDictionary[str, Job]" = WeakValueDictionary()
+        self.blocking = blocking
+
+        # str(job.trigger) per job id, kept current by _handle_job_changed
+        self._trigger_desc: Dict[str, str] = {}
+
+        # "asyncio" runs jobs on one event loop: coroutine jobs are awaited
+        # there, plain functions go to the loop's default executor
+        executor_type = self.config.get("monitoring", {}).get(
+            "scheduler_executor", "threadpool"
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
 
         # Configure job defaults
         job_defaults = {
@@ -38,24 +77,75 @@ class MonitorScheduler:
         }
 
         # Create scheduler
-        if blocking:
-            self.scheduler = BlockingScheduler(
-                executors=executors, job_defaults=job_defaults, timezone="UTC"
+        if executor_type == "asyncio":
+            self._loop = asyncio.new_event_loop()
+            self.scheduler = AsyncIOScheduler(
+                event_loop=self._loop,
+                executors={"default": AsyncIOExecutor()},
+                job_defaults=job_defaults,
+                timezone="UTC",
             )
         else:
-            self.scheduler = BackgroundScheduler(
-                executors=executors, job_defaults=job_defaults, timezone="UTC"
-            )
+            # Configure executors
+            executors = {
+                "default": ThreadPoolExecutor(max_workers=self._get_max_workers())
+            }
+
+            if blocking:
+                self.scheduler = BlockingScheduler(
+                    executors=executors, job_defaults=job_defaults, timezone="UTC"
+                )
+            else:
+                self.scheduler = BackgroundScheduler(
+                    executors=executors, job_defaults=job_defaults, timezone="UTC"
+                )
 
         # Add event listeners
         self.scheduler.add_listener(self._handle_job_error, EVENT_JOB_ERROR)
 
         self.scheduler.add_listener(self._handle_job_executed, EVENT_JOB_EXECUTED)
 
+        self.scheduler.add_listener(
+            self._handle_job_changed,
+            EVENT_JOB_ADDED | EVENT_JOB_MODIFIED | EVENT_JOB_REMOVED,
+        )
+
         self.logger.info(
-            f"Scheduler initialized ({'blocking' if blocking else 'background'} mode)"
+            "Scheduler initialized (%s mode, %s executor)",
+            "blocking" if blocking else "background",
+            executor_type,
         )
 
+    def _get_max_workers(self) -> int:
+        """
+        Get the job thread pool size.
+
+        Each job runs at most one instance at a time, so only a handful of
+        threads are ever busy; small machines get fewer of them.
+
+        Returns:
+            monitoring.scheduler_max_workers if set, otherwise
+            min(5, 2 * CPU count)
+        """
+        max_workers = self.config.get("monitoring", {}).get("scheduler_max_workers")
+        if max_workers is None:
+            max_workers = min(5, (os.cpu_count() or 1) * 2)
+        return max(1, int(max_workers))
+
+    @staticmethod
+    def _bind(func: Callable, kwargs: Dict[str, Any]) -> Callable:
+        """
+        Bind job arguments to the function once, at registration.
+
+        Args:
+            func: Function to execute
+            kwargs: Keyword arguments for the function
+
+        Returns:
+            func itself, or a functools.partial carrying the arguments
+        """
+        return functools.partial(func, **kwargs) if kwargs else func
+
     def add_interval_job(
         self,
         job_id: str,
@@ -91,16 +181,17 @@ class MonitorScheduler:
 
         # Add job
         job = self.scheduler.add_job(
-            func,
+            self._bind(func, kwargs),
             trigger,
             id=job_id,
             name=f"Monitor Job: {job_id}",
-            kwargs=kwargs,
             replace_existing=True,
         )
 
         self.jobs[job_id] = job
-        self.logger.info(f"Added interval job '{job_id}' running every {interval_str}")
+        self.logger.info(
+            "Added interval job '%s' running every %s", job_id, interval_str
+        )
 
         return job_id
 
@@ -128,15 +219,14 @@ class MonitorScheduler:
             Job ID
         """
         # Create cron trigger
-        trigger = CronTrigger(hour=hour, minute=minute, day_of_week=day_of_week)
+        trigger = _cron_trigger(hour, minute, day_of_week)
 
         # Add job
         job = self.scheduler.add_job(
-            func,
+            self._bind(func, kwargs),
             trigger,
             id=job_id,
             name=f"Cron Job: {job_id}",
-            kwargs=kwargs,
             replace_existing=True,
         )
 
@@ -151,7 +241,7 @@ class MonitorScheduler:
             schedule_desc.append(f"day={day_of_week}")
 
         self.logger.info(
-            f"Added cron job '{job_id}' with schedule: {', '.join(schedule_desc)}"
+            "Added cron job '%s' with schedule: %s", job_id, ", ".join(schedule_desc)
         )
 
         return job_id
@@ -172,17 +262,16 @@ class MonitorScheduler:
             Job ID
         """
         job = self.scheduler.add_job(
-            func,
+            self._bind(func, kwargs),
             "date",
             run_date=run_date,
             id=job_id,
             name=f"One-time Job: {job_id}",
-            kwargs=kwargs,
             replace_existing=True,
         )
 
         self.jobs[job_id] = job
-        self.logger.info(f"Added one-time job '{job_id}' scheduled for {run_date}")
+        self.logger.info("Added one-time job '%s' scheduled for %s", job_id, run_date)
 
         return job_id
 
@@ -198,12 +287,11 @@ class MonitorScheduler:
         """
         try:
             self.scheduler.remove_job(job_id)
-            if job_id in self.jobs:
-                del self.jobs[job_id]
-            self.logger.info(f"Removed job '{job_id}'")
+            self.jobs.pop(job_id, None)
+            self.logger.info("Removed job '%s'", job_id)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to remove job '{job_id}': {e}")
+            self.logger.error("Failed to remove job '%s': %s", job_id, e)
             return False
 
     def pause_job(self, job_id: str) -> bool:
@@ -218,10 +306,10 @@ class MonitorScheduler:
         """
         try:
             self.scheduler.pause_job(job_id)
-            self.logger.info(f"Paused job '{job_id}'")
+            self.logger.info("Paused job '%s'", job_id)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to pause job '{job_id}': {e}")
+            self.logger.error("Failed to pause job '%s': %s", job_id, e)
             return False
 
     def resume_job(self, job_id: str) -> bool:
@@ -236,10 +324,10 @@ class MonitorScheduler:
         """
         try:
             self.scheduler.resume_job(job_id)
-            self.logger.info(f"Resumed job '{job_id}'")
+            self.logger.info("Resumed job '%s'", job_id)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to resume job '{job_id}': {e}")
+            self.logger.error("Failed to resume job '%s': %s", job_id, e)
             return False
 
     def get_job_info(self, job_id: str) -> Optional[Dict[str, Any]]:
@@ -254,13 +342,7 @@ class MonitorScheduler:
         """
         job = self.scheduler.get_job(job_id)
         if job:
-            return {
-                "id": job.id,
-                "name": job.name,
-                "next_run_time": job.next_run_time,
-                "pending": job.pending,
-                "trigger": str(job.trigger),
-            }
+            return self._job_info(job)
         return None
 
     def list_jobs(self) -> List[Dict[str, Any]]:
@@ -270,25 +352,82 @@ class MonitorScheduler:
         Returns:
             List of job information dictionaries
         """
-        jobs_info = []
-        for job in self.scheduler.get_jobs():
-            jobs_info.append(
-                {
-                    "id": job.id,
-                    "name": job.name,
-                    "next_run_time": job.next_run_time,
-                    "pending": job.pending,
-                    "trigger": str(job.trigger),
-                }
-            )
-        return jobs_info
+        return [self._job_info(job) for job in self.scheduler.get_jobs()]
+
+    def _job_info(self, job) -> Dict[str, Any]:
+        """
+        Describe a job.
+
+        Args:
+            job: APScheduler job
+
+        Returns:
+            Dictionary with job information
+        """
+        trigger = self._trigger_desc.get(job.id)
+        if trigger is None:
+            trigger = self._trigger_desc[job.id] = str(job.trigger)
+        return {
+            "id": job.id,
+            "name": job.name,
+            "next_run_time": job.next_run_time,
+            "pending": job.pending,
+            "trigger": trigger,
+        }
 
     def start(self):
         """Start the scheduler."""
         self.logger.info("Starting scheduler...")
-        self.scheduler.start()
+        if self._loop is None:
+            self.scheduler.start()
+        elif self.blocking:
+            # Run the event loop in this thread until shutdown() stops it
+            asyncio.set_event_loop(self._loop)
+            self.scheduler.start()
+            self.logger.info("Scheduler started")
+            self._loop.run_forever()
+            return
+        else:
+            # Start the scheduler from inside its loop, running in a thread
+            started = threading.Event()
+            failure: List[Exception] = []
+            self._loop_thread = threading.Thread(
+                target=self._run_loop,
+                args=(started, failure),
+                name="scheduler-loop",
+                daemon=True,
+            )
+            self._loop_thread.start()
+            started.wait()
+            if failure:
+                # The loop thread stopped its loop; surface the error here
+                self._loop_thread.join()
+                self._loop_thread = None
+                raise failure[0]
         self.logger.info("Scheduler started")
 
+    def _run_loop(self, started: threading.Event, failure: List[Exception]):
+        """
+        Run the scheduler's event loop (background asyncio mode).
+
+        Args:
+            started: Set once the scheduler is running or has failed to start
+            failure: Receives the exception if the scheduler fails to start
+        """
+        asyncio.set_event_loop(self._loop)
+
+        def _start():
+            try:
+                self.scheduler.start()
+            except Exception as e:
+                failure.append(e)
+                self._loop.stop()
+            finally:
+                started.set()
+
+        self._loop.call_soon(_start)
+        self._loop.run_forever()
+
     def shutdown(self, wait: bool = True):
         """
         Shutdown the scheduler.
@@ -302,9 +441,25 @@ class MonitorScheduler:
             return
 
         self.logger.info("Shutting down scheduler...")
-        self.scheduler.shutdown(wait=wait)
+        if self._loop is None:
+            self.scheduler.shutdown(wait=wait)
+        elif self._loop_thread is not None:
+            # The scheduler belongs to the loop thread: stop it there
+            asyncio.run_coroutine_threadsafe(
+                self._shutdown_async(wait), self._loop
+            ).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop_thread = None
+        else:
+            self.scheduler.shutdown(wait=wait)
+            self._loop.stop()
         self.logger.info("Scheduler shut down")
 
+    async def _shutdown_async(self, wait: bool):
+        """Shut down the scheduler from within its event loop."""
+        self.scheduler.shutdown(wait=wait)
+
     def run_job_now(self, job_id: str) -> bool:
         """
         Run a job immediately.
@@ -313,36 +468,66 @@ class MonitorScheduler:
             job_id: Job identifier
 
         Returns:
-            True if job was triggered
+            True if job was triggered or is already running
         """
         try:
-            job = self.scheduler.get_job(job_id)
-            if job:
-                job.modify(next_run_time=datetime.now())
-                self.logger.info(f"Triggered immediate execution of job '{job_id}'")
-                return True
-            else:
-                self.logger.error(f"Job '{job_id}' not found")
+            job = self.jobs.get(job_id)
+            if not job:
+                self.logger.error("Job '%s' not found", job_id)
                 return False
+
+            now = datetime.now(self.scheduler.timezone)
+            # The fast path relies on APScheduler 3.x internals (pinned <4 in
+            # requirements.txt); without them, fall back to the public API
+            jobstores = getattr(self.scheduler, "_jobstores", {})
+            lookup_executor = getattr(self.scheduler, "_lookup_executor", None)
+            store = jobstores.get(getattr(job, "_jobstore_alias", None))
+            current = (
+                store.lookup_job(job_id) if isinstance(store, MemoryJobStore) else None
+            )
+            if current is not None and lookup_executor and self._loop is None:
+                # In-memory job on the thread pool: hand it straight to its
+                # executor instead of rescheduling it through the jobstore
+                try:
+                    lookup_executor(current.executor).submit_job(current, [now])
+                except MaxInstancesReachedError:
+                    # Same outcome as a coalesced run: the job is running now
+                    self.logger.info("Job '%s' is already running", job_id)
+                    return True
+            else:
+                job.modify(next_run_time=now)
+
+            self.logger.info("Triggered immediate execution of job '%s'", job_id)
+            return True
         except Exception as e:
-            self.logger.error(f"Failed to run job '{job_id}' immediately: {e}")
+            self.logger.error("Failed to run job '%s' immediately: %s", job_id, e)
             return False
 
+    def _job_name(self, job_id: str) -> str:
+        """Get a job's display name from the local registry (no jobstore lookup)."""
+        job = self.jobs.get(job_id)
+        return job.name if job else job_id
+
     def _handle_job_error(self, event):
         """Handle job execution errors."""
-        job = self.scheduler.get_job(event.job_id)
-        if job:
-            self.logger.error(
-                f"Job '{job.name}' (ID: {event.job_id}) failed with error: {event.exception}"
-            )
+        self.logger.error(
+            "Job '%s' (ID: %s) failed with error: %s",
+            self._job_name(event.job_id),
+            event.job_id,
+            event.exception,
+        )
+
+    def _handle_job_changed(self, event):
+        """Drop the cached trigger description of an added/modified/removed job."""
+        self._trigger_desc.pop(event.job_id, None)
 
     def _handle_job_executed(self, event):
         """Handle successful job execution."""
-        job = self.scheduler.get_job(event.job_id)
-        if job:
-            self.logger.debug(
-                f"Job '{job.name}' (ID: {event.job_id}) executed successfully"
-            )
+        self.logger.debug(
+            "Job '%s' (ID: %s) executed successfully",
+            self._job_name(event.job_id),
+            event.job_id,
+        )
 
     def get_next_run_times(self, count: int = 5) -> List[Dict[str, Any]]:
         """
@@ -354,17 +539,14 @@ class MonitorScheduler:
         Returns:
             List of upcoming job runs
         """
-        upcoming = []
-        jobs = self.scheduler.get_jobs()
-
-        # Sort jobs by next run time
-        jobs_sorted = sorted(
-            [j for j in jobs if j.next_run_time], key=lambda x: x.next_run_time
+        # Only the first `count` jobs are needed, so avoid sorting them all
+        jobs = heapq.nsmallest(
+            count,
+            (j for j in self.scheduler.get_jobs() if j.next_run_time),
+            key=lambda j: j.next_run_time,
         )
 
-        for job in jobs_sorted[:count]:
-            upcoming.append(
-                {"job_id": job.id, "job_name": job.name, "next_run": job.next_run_time}
-            )
-
-        return upcoming
+        return [
+            {"job_id": job.id, "job_name": job.name, "next_run": job.next_run_time}
+            for job in jobs
+        ]
@@ -2,25 +2,82 @@
 
 import logging
 import os
+import stat
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-try:
-    import keyring
-
-    KEYRING_AVAILABLE = True
-except ImportError:
-    KEYRING_AVAILABLE = False
-    logging.warning("keyring not available, using environment variables only")
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Union
 
 from dotenv import load_dotenv
 
+# Bound once: os.getenv() is a Python-level wrapper around os.environ.get()
+_environ_get = os.environ.get
+
+# Mask characters are sliced from this instead of built per call
+_STARS = "*" * 256
+
+# Common .env locations, in priority order. The first two are relative so
+# they resolve against the working directory at lookup time.
+_ENV_CANDIDATES = (
+    Path(".env"),
+    Path("config") / ".env",
+    Path(__file__).parent.parent.parent / "config" / ".env",
+)
+
+# keyring pulls in platform bindings (D-Bus, win32cred, ...) and is only used
+# in production, so it is imported on first use rather than at module import
+_keyring = None
+_keyring_loaded = False
+
+
+def _get_keyring():
+    """
+    Import the keyring module on first use.
+
+    Returns:
+        The keyring module, or None if it isn't installed
+    """
+    global _keyring, _keyring_loaded
+    if not _keyring_loaded:
+        try:
+            import keyring
+
+            _keyring = keyring
+        except ImportError:
+            logging.warning("keyring not available, using environment variables only")
+        _keyring_loaded = True
+    return _keyring
+
+
+def _first_regular_file(
+    paths: Iterable[Union[str, Path]],
+) -> Optional[Union[str, Path]]:
+    """
+    Find the first path that is a regular file, with one stat() per candidate.
+
+    Args:
+        paths: Candidate paths, in priority order
+
+    Returns:
+        The first regular file, or None if there is none
+    """
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            return path
+    return None
+
 
 class CredentialManager:
     """Manage credentials securely using keyring or environment variables."""
 
     SERVICE_NAME = "inforuta-monitor"
 
+    __slots__ = ("logger", "use_keyring", "_cache", "_cache_lock", "_bundles")
+
     def __init__(self, env_file: Optional[str] = None):
         """
         Initialize credential manager.
@@ -30,26 +87,25 @@ class CredentialManager:
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.use_keyring = (
-            KEYRING_AVAILABLE and os.getenv("ENVIRONMENT") == "production"
+            _environ_get("ENVIRONMENT") == "production" and _get_keyring() is not None
         )
 
-        # Load environment variables from .env file
-        if env_file and Path(env_file).exists() and Path(env_file).is_file():
-            load_dotenv(env_file)
-            self.logger.info(f"Loaded environment from {env_file}")
-        else:
-            # Try to find .env in common locations
-            possible_paths = [
-                Path.cwd() / ".env",
-                Path.cwd() / "config" / ".env",
-                Path(__file__).parent.parent.parent / "config" / ".env",
-            ]
-
-            for path in possible_paths:
-                if path.exists() and path.is_file():
-                    load_dotenv(path)
-                    self.logger.info(f"Loaded environment from {path}")
-                    break
+        # Credentials don't change while the process runs, so each key is
+        # looked up (keyring round-trip + environment) once and cached
+        self._cache: Dict[str, Optional[str]] = {}
+        self._cache_lock = threading.Lock()
+
+        # Read-only credential bundles (per site, email, telegram), built on
+        # first use from the cached values above
+        self._bundles: Dict[str, Mapping[str, Any]] = {}
+
+        # Load environment variables from the given .env file, falling back
+        # to the common locations
+        candidates = (env_file, *_ENV_CANDIDATES) if env_file else _ENV_CANDIDATES
+        path = _first_regular_file(candidates)
+        if path is not None:
+            load_dotenv(path)
+            self.logger.info("Loaded environment from %s", path)
 
     def get_credential(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
@@ -62,23 +118,148 @@ class CredentialManager:
         Returns:
             Credential value or default
         """
+        with self._cache_lock:
+            if key in self._cache:
+                value = self._cache[key]
+            else:
+                value = self._cache[key] = self._lookup_credential(key)
+
+        return value if value is not None else default
+
+    def _lookup_credential(self, key: str) -> Optional[str]:
+        """
+        Look up a credential in the keyring and environment, bypassing the cache.
+
+        Args:
+            key: Credential key
+
+        Returns:
+            Credential value, or None if not set
+        """
         # Try keyring first if available and in production
         if self.use_keyring:
             try:
-                value = keyring.get_password(self.SERVICE_NAME, key)
+                value = _get_keyring().get_password(self.SERVICE_NAME, key)
                 if value:
-                    self.logger.debug(f"Retrieved {key} from keyring")
+                    self.logger.debug("Retrieved %s from keyring", key)
                     return value
             except Exception as e:
-                self.logger.warning(f"Failed to get {key} from keyring: {e}")
+                self.logger.warning("Failed to get %s from keyring: %s", key, e)
+
+        return self._lookup_env(key)
+
+    def _lookup_env(self, key: str) -> Optional[str]:
+        """
+        Look up a credential in the environment only.
 
-        # Fall back to environment variable
-        value = os.getenv(key, default)
-        if value and value != default:
-            self.logger.debug(f"Retrieved {key} from environment")
+        Args:
+            key: Credential key
+
+        Returns:
+            Credential value, or None if not set
+        """
+        value = _environ_get(key)
+        if value:
+            self.logger.debug("Retrieved %s from environment", key)
 
         return value
 
+    def _get_many(self, keys: Iterable[str]):
+        """
+        Load several credentials into the cache with one keyring query.
+
+        On a Secret Service backend every secret stored under SERVICE_NAME is
+        fetched in a single collection search; other backends fall back to
+        the per-key lookup. Keys not found in the keyring come from the
+        environment, as in get_credential().
+
+        Args:
+            keys: Credential keys to load
+        """
+        with self._cache_lock:
+            missing = [key for key in keys if key not in self._cache]
+            if not missing:
+                return
+
+            found = self._search_keyring() if self.use_keyring else None
+            for key in missing:
+                if found is None:
+                    value = self._lookup_credential(key)
+                else:
+                    value = found.get(key) or self._lookup_env(key)
+                self._cache[key] = value
+
+    def _search_keyring(self) -> Optional[Dict[str, str]]:
+        """
+        Fetch every secret of this service from the keyring in one query.
+
+        Returns:
+            Mapping of credential key to value, or None if the backend
+            doesn't support searching or the search failed
+        """
+        try:
+            from keyring.backends.SecretService import Keyring as SecretService
+
+            backend = _get_keyring().get_keyring()
+            if not isinstance(backend, SecretService):
+                return None
+
+            collection = backend.get_preferred_collection()
+            secrets = {}
+            for item in collection.search_items({"service": self.SERVICE_NAME}):
+                if item.is_locked():
+                    item.unlock()
+                username = item.get_attributes().get("username")
+                if username:
+                    secrets[username] = item.get_secret().decode("utf-8")
+        except Exception as e:
+            self.logger.warning("Batch keyring lookup failed: %s", e)
+            return None
+
+        self.logger.debug("Retrieved %d credentials from keyring", len(secrets))
+        return secrets
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Drop cached credential values so they are looked up again.
+
+        Args:
+            key: Credential key to drop, or None to clear the whole cache
+        """
+        with self._cache_lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+
+    def refresh(self):
+        """Forget all cached credentials and bundles so they are reloaded."""
+        self._bundles.clear()
+        self.invalidate()
+
+    def _get_bundle(
+        self,
+        name: str,
+        keys: Iterable[str],
+        build: Callable[[], Dict[str, Any]],
+    ) -> Mapping[str, Any]:
+        """
+        Get a cached read-only credential bundle, building it on first use.
+
+        Args:
+            name: Bundle name
+            keys: Credential keys the bundle reads, loaded together
+            build: Function returning the bundle contents
+
+        Returns:
+            Read-only mapping of credential values
+        """
+        bundle = self._bundles.get(name)
+        if bundle is None:
+            self._get_many(keys)
+            bundle = self._bundles[name] = MappingProxyType(build())
+        return bundle
+
     def set_credential(self, key: str, value: str) -> bool:
         """
         Set a credential value.
@@ -92,16 +273,18 @@ class CredentialManager:
         """
         if self.use_keyring:
             try:
-                keyring.set_password(self.SERVICE_NAME, key, value)
-                self.logger.info(f"Stored {key} in keyring")
+                _get_keyring().set_password(self.SERVICE_NAME, key, value)
+                self.logger.info("Stored %s in keyring", key)
+                with self._cache_lock:
+                    self._cache[key] = value
                 return True
             except Exception as e:
-                self.logger.error(f"Failed to store {key} in keyring: {e}")
+                self.logger.error("Failed to store %s in keyring: %s", key, e)
                 return False
         else:
             # For development, just log that we would store it
             self.logger.info(
-                f"Would store {key} (keyring not available or not in production)"
+                "Would store %s (keyring not available or not in production)", key
             )
             return True
 
@@ -117,15 +300,16 @@ class CredentialManager:
         """
         if self.use_keyring:
             try:
-                keyring.delete_password(self.SERVICE_NAME, key)
-                self.logger.info(f"Deleted {key} from keyring")
+                _get_keyring().delete_password(self.SERVICE_NAME, key)
+                self.logger.info("Deleted %s from keyring", key)
+                self.invalidate(key)
                 return True
             except Exception as e:
-                self.logger.warning(f"Failed to delete {key} from keyring: {e}")
+                self.logger.warning("Failed to delete %s from keyring: %s", key, e)
                 return False
         return True
 
-    def get_credentials_by_key(self, key: str) -> Dict[str, Optional[str]]:
+    def get_credentials_by_key(self, key: str) -> Mapping[str, Optional[str]]:
         """
         Get credentials for a specific site by key.
 
@@ -133,38 +317,42 @@ class CredentialManager:
             key: Site credential key (e.g., 'inforuta', 'vialidad', 'fomento')
 
         Returns:
-            Dictionary with username and password
+            Read-only mapping with username and password
         """
         key_upper = key.upper()
-        return {
-            "username": self.get_credential(f"{key_upper}_USERNAME"),
-            "password": self.get_credential(f"{key_upper}_PASSWORD"),
-        }
+        return self._get_bundle(
+            key_upper,
+            (f"{key_upper}_USERNAME", f"{key_upper}_PASSWORD"),
+            lambda: {
+                "username": self.get_credential(f"{key_upper}_USERNAME"),
+                "password": self.get_credential(f"{key_upper}_PASSWORD"),
+            },
+        )
 
-    def get_inforuta_credentials(self) -> Dict[str, Optional[str]]:
+    def get_inforuta_credentials(self) -> Mapping[str, Optional[str]]:
         """
         Get InfoRuta login credentials.
 
         Returns:
-            Dictionary with username and password
+            Read-only mapping with username and password
         """
         return self.get_credentials_by_key("inforuta")
 
-    def get_vialidad_credentials(self) -> Dict[str, Optional[str]]:
+    def get_vialidad_credentials(self) -> Mapping[str, Optional[str]]:
         """
         Get Vialidad ACP login credentials.
 
         Returns:
-            Dictionary with username and password
+            Read-only mapping with username and password
         """
         return self.get_credentials_by_key("vialidad")
 
-    def get_fomento_credentials(self) -> Dict[str, Optional[str]]:
+    def get_fomento_credentials(self) -> Mapping[str, Optional[str]]:
         """
         Get Fomento VI login credentials.
 
         Returns:
-            Dictionary with username and password
+            Read-only mapping with username and password
         """
         return self.get_credentials_by_key("fomento")
 
@@ -173,15 +361,29 @@ class CredentialManager:
         Get email configuration.
 
         Returns:
-            Dictionary with email settings
+            Dictionary with email settings (a copy the caller may modify)
         """
-        return {
-            "from_address": self.get_credential("EMAIL_FROM"),
-            "to_address": self.get_credential("EMAIL_TO"),
-            "password": self.get_credential("EMAIL_PASSWORD"),
-            "smtp_server": self.get_credential("SMTP_SERVER", "smtp.gmail.com"),
-            "smtp_port": int(self.get_credential("SMTP_PORT", "587")),
-        }
+        return dict(
+            self._get_bundle(
+                "EMAIL",
+                (
+                    "EMAIL_FROM",
+                    "EMAIL_TO",
+                    "EMAIL_PASSWORD",
+                    "SMTP_SERVER",
+                    "SMTP_PORT",
+                ),
+                lambda: {
+                    "from_address": self.get_credential("EMAIL_FROM"),
+                    "to_address": self.get_credential("EMAIL_TO"),
+                    "password": self.get_credential("EMAIL_PASSWORD"),
+                    "smtp_server": self.get_credential(
+                        "SMTP_SERVER", "smtp.gmail.com"
+                    ),
+                    "smtp_port": int(self.get_credential("SMTP_PORT", "587")),
+                },
+            )
+        )
 
     def get_slack_webhook(self) -> Optional[str]:
         """
@@ -192,17 +394,21 @@ class CredentialManager:
         """
         return self.get_credential("SLACK_WEBHOOK")
 
-    def get_telegram_credentials(self) -> Dict[str, Optional[str]]:
+    def get_telegram_credentials(self) -> Mapping[str, Optional[str]]:
         """
         Get Telegram bot configuration.
 
         Returns:
-            Dictionary with bot_token and chat_id
+            Read-only mapping with bot_token and chat_id
         """
-        return {
-            "bot_token": self.get_credential("TELEGRAM_BOT_TOKEN"),
-            "chat_id": self.get_credential("TELEGRAM_CHAT_ID"),
-        }
+        return self._get_bundle(
+            "TELEGRAM",
+            ("TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID"),
+            lambda: {
+                "bot_token": self.get_credential("TELEGRAM_BOT_TOKEN"),
+                "chat_id": self.get_credential("TELEGRAM_CHAT_ID"),
+            },
+        )
 
     def get_healthcheck_url(self) -> Optional[str]:
         """
@@ -252,7 +458,13 @@ class CredentialManager:
         Returns:
             Masked value
         """
-        if not value or len(value) <= visible_chars:
-            return "*" * len(value) if value else ""
-
-        return value[:visible_chars] + "*" * (len(value) - visible_chars)
+        if not value:
+            return ""
+
+        n = len(value)
+        if n > len(_STARS):
+            # Longer than any real credential - build the mask directly
+            return value[:visible_chars] + "*" * max(0, n - visible_chars)
+        if n <= visible_chars:
+            return _STARS[:n]
+        return value[:visible_chars] + _STARS[: n - visible_chars]
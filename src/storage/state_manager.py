@@ -1,22 +1,53 @@
 """State management for tracking check history and results."""
 
+import gzip
+import hashlib
 import json
 import logging
 import os
 import tempfile
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..checkers.base_checker import CheckResult, CheckStatus
 
+# Per-check failure/recovery times, datetimes in memory and ISO strings on disk
+_STAT_TIME_KEYS = ("last_failure_time", "last_recovery_time")
+
+# Leading bytes of a gzip stream, used to detect a compressed state file
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the state types the JSON encoders don't handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, deque):
+        return list(obj)
+    return str(obj)
+
 
 class StateManager:
     """Manage and persist monitoring state."""
 
     def __init__(
-        self, state_file: str = "./logs/monitor_state.json", history_size: int = 100
+        self,
+        state_file: str = "./logs/monitor_state.json",
+        history_size: int = 100,
+        snapshot_every: int = 100,
+        durability: Literal["none", "fsync", "fsync+dir"] = "fsync",
+        max_sites: int = 10_000,
+        compress: bool = False,
     ):
         """
         Initialize state manager.
@@ -24,27 +55,80 @@ class StateManager:
         Args:
             state_file: Path to state persistence file
             history_size: Number of historical results to keep
+            snapshot_every: Results appended to the state log before the
+                full state file is rewritten
+            durability: How state file writes are synced to disk: "none"
+                leaves it to the page cache, "fsync" syncs the file before
+                the rename, "fsync+dir" also syncs the directory after it
+            max_sites: Sites to keep state for; the least recently checked
+                site is dropped beyond this
+            compress: Write the state file gzip-compressed (either form is
+                read back)
         """
+        if durability not in ("none", "fsync", "fsync+dir"):
+            raise ValueError(f"Unknown durability mode: {durability}")
+
         self.state_file = Path(state_file)
         self.history_size = history_size
+        self.snapshot_every = snapshot_every
+        self.durability = durability
+        self.max_sites = max_sites
+        self.compress = compress
         self.logger = logging.getLogger(self.__class__.__name__)
 
         # State data - now per-site
         # Structure: { "site_name": { last_check_time, last_results, history, statistics } }
+        # Sites are kept in least to most recently checked order
         self.state = {
-            "sites": {},
+            "sites": OrderedDict(),
             "global": {
                 "last_check_time": None,
                 "total_checks": 0,
             },
         }
 
+        # Set when in-memory state has changes not yet written by save_state()
+        self._dirty = False
+
+        # Bumped on every in-memory change; the all-sites summary is cached
+        # against it
+        self._generation = 0
+        self._summary_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+        # Digest of the last state file written, to skip identical rewrites
+        self._saved_digest: Optional[bytes] = None
+
+        # Results are appended to a JSONL log between full snapshots. Each
+        # entry has a sequence number; the snapshot stores the last one it
+        # includes so entries are never applied twice on replay.
+        self.log_file = self.state_file.with_suffix(".log")
+
+        # Path strings used on every save, and whether the directory exists
+        self._dir_str = str(self.state_file.parent)
+        self._target_str = str(self.state_file)
+        self._temp_prefix = f".{self.state_file.name}."
+        self._dir_ready = False
+        self._log_handle = None
+        self._log_entries = 0
+        self._seq = 0
+
         # Load existing state
         self.load_state()
 
     def load_state(self) -> bool:
         """
-        Load state from file.
+        Load state from the state file, then replay the state log.
+
+        Returns:
+            True if any state was loaded
+        """
+        loaded = self._load_snapshot()
+        replayed = self._replay_log()
+        return loaded or replayed > 0
+
+    def _load_snapshot(self) -> bool:
+        """
+        Load the full state file.
 
         Returns:
             True if loaded successfully
@@ -54,8 +138,12 @@ class StateManager:
             return False
 
         try:
-            with open(self.state_file, "r") as f:
-                loaded_state = json.load(f)
+            with open(self.state_file, "rb") as f:
+                data = f.read()
+                if data[:2] == _GZIP_MAGIC:
+                    data = gzip.decompress(data)
+                loaded_state = json.loads(data)
+                self._seq = loaded_state.pop("log_seq", 0)
 
                 # Merge loaded state with defaults
                 if "sites" in loaded_state:
@@ -68,18 +156,34 @@ class StateManager:
                     )
                     self._migrate_old_state(loaded_state)
 
+                # Saved site order is recency order
+                self.state["sites"] = OrderedDict(self.state.get("sites", {}))
+
                 # Convert ISO strings back to datetime objects where needed
                 if self.state.get("global", {}).get("last_check_time"):
                     self.state["global"]["last_check_time"] = datetime.fromisoformat(
                         self.state["global"]["last_check_time"]
                     )
 
-                # Convert per-site timestamps
+                # Convert per-site timestamps and bound the history lists
                 for site_name, site_state in self.state.get("sites", {}).items():
                     if site_state.get("last_check_time"):
                         site_state["last_check_time"] = datetime.fromisoformat(
                             site_state["last_check_time"]
                         )
+                    site_state["history"] = {
+                        check_type: deque(history, maxlen=self.history_size)
+                        for check_type, history in site_state.get(
+                            "history", {}
+                        ).items()
+                    }
+                    stats = site_state.get("statistics", {})
+                    for key in _STAT_TIME_KEYS:
+                        if key in stats:
+                            stats[key] = {
+                                check_type: datetime.fromisoformat(ts)
+                                for check_type, ts in stats[key].items()
+                            }
 
                 self.logger.info(f"Loaded state from {self.state_file}")
                 return True
@@ -88,6 +192,86 @@ class StateManager:
             self.logger.error(f"Failed to load state: {e}")
             return False
 
+    def _replay_log(self) -> int:
+        """
+        Apply results from the state log that the state file doesn't include.
+
+        Returns:
+            Number of results replayed
+        """
+        try:
+            with open(self.log_file, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            self.logger.error(f"Failed to read state log: {e}")
+            return 0
+
+        replayed = 0
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                if entry["seq"] <= self._seq:
+                    continue
+                self._apply_result(
+                    CheckResult.from_dict(entry["result"]),
+                    entry["site"],
+                    datetime.fromisoformat(entry["t"]),
+                    payload=entry["result"],
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                # A crash mid-append can leave a partial last line
+                self.logger.warning(f"Skipping unreadable state log entry: {e}")
+                continue
+            self._seq = entry["seq"]
+            replayed += 1
+
+        self._log_entries = len(lines)
+        if replayed:
+            self.logger.info(f"Replayed {replayed} result(s) from {self.log_file}")
+        return replayed
+
+    def _append_log(self, lines: List[str]):
+        """
+        Append entries to the state log with a single write.
+
+        Args:
+            lines: JSON-encoded log entries
+        """
+        try:
+            if self._log_handle is None:
+                self._ensure_dir()
+                self._log_handle = open(
+                    self.log_file, "a", buffering=1, encoding="utf-8"
+                )
+            self._log_handle.write("\n".join(lines) + "\n")
+            self._log_entries += len(lines)
+        except Exception as e:
+            self.logger.error(f"Failed to append to state log: {e}")
+            # Don't lose the results: fall back to a full snapshot
+            self.save_state()
+
+    def _truncate_log(self):
+        """Remove the state log once a snapshot includes all of its entries."""
+        self._close_log()
+        try:
+            self.log_file.unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Failed to remove state log: {e}")
+        self._log_entries = 0
+
+    def _close_log(self):
+        """Close the state log file handle, if open."""
+        if self._log_handle is not None:
+            self._log_handle.close()
+            self._log_handle = None
+
+    def close(self):
+        """Write a final snapshot and release the state log."""
+        self.flush()
+        self._close_log()
+
     def save_state(self) -> bool:
         """
         Save state to file using atomic write.
@@ -99,31 +283,42 @@ class StateManager:
             True if saved successfully
         """
         try:
-            # Ensure directory exists
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir()
+
+            payload = self._serialize_state()
 
-            # Prepare state for JSON serialization
-            state_to_save = self._prepare_for_serialization(self.state)
+            # Nothing changed since the last save: skip the write and fsync
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._saved_digest and self.state_file.exists():
+                self._dirty = False
+                self.logger.debug("State unchanged, skipping save")
+                return True
 
             # Atomic write: write to temporary file, then rename
             # This ensures either the old file or new file exists, never corrupted partial file
             temp_fd, temp_path = tempfile.mkstemp(
-                dir=self.state_file.parent,
-                prefix=f".{self.state_file.name}.",
-                suffix=".tmp"
+                dir=self._dir_str, prefix=self._temp_prefix, suffix=".tmp"
             )
 
             try:
                 # Write to temporary file
-                with os.fdopen(temp_fd, 'w') as f:
-                    json.dump(state_to_save, f, indent=2, default=str)
-                    # Ensure data is written to disk
-                    f.flush()
-                    os.fsync(f.fileno())
+                if self.compress:
+                    payload = gzip.compress(payload, compresslevel=3, mtime=0)
+                with os.fdopen(temp_fd, "wb") as f:
+                    f.write(payload)
+                    if self.durability != "none":
+                        # Ensure data is written to disk
+                        f.flush()
+                        os.fsync(f.fileno())
 
                 # Atomically replace old file with new file
                 # On POSIX systems, rename() is atomic
-                os.replace(temp_path, str(self.state_file))
+                os.replace(temp_path, self._target_str)
+                if self.durability == "fsync+dir":
+                    self._fsync_dir()
+                self._saved_digest = digest
+                self._dirty = False
+                self._truncate_log()
 
                 self.logger.debug(f"Saved state to {self.state_file} (atomic write)")
                 return True
@@ -138,11 +333,61 @@ class StateManager:
 
         except Exception as e:
             self.logger.error(f"Failed to save state: {e}")
+            # The directory may have been removed; recreate it next time
+            self._dir_ready = False
             return False
 
-    def _get_site_state(self, site_name: str) -> Dict[str, Any]:
+    def _ensure_dir(self):
+        """Create the state directory, once per manager."""
+        if not self._dir_ready:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
+    def _fsync_dir(self):
+        """Sync the state directory so the rename itself survives a crash."""
+        try:
+            dir_fd = os.open(self._dir_str, os.O_RDONLY)
+        except OSError as e:
+            # Directories can't be opened this way on Windows
+            self.logger.debug(f"Cannot open state directory for fsync: {e}")
+            return
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _serialize_state(self) -> bytes:
+        """
+        Encode the full state for the state file.
+
+        The state is encoded in place; datetimes and history deques are
+        converted by the encoder's default hook as they are reached.
+
+        Returns:
+            JSON document as bytes
         """
-        Get or create state for a specific site.
+        state = {**self.state, "log_seq": self._seq}
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                state, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+            )
+        return json.dumps(state, indent=2, default=_json_default).encode("utf-8")
+
+    def _peek_site_state(self, site_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get state for a specific site without creating it.
+
+        Args:
+            site_name: Name of the site
+
+        Returns:
+            Site state dictionary, or None if the site has no state yet
+        """
+        return self.state["sites"].get(site_name)
+
+    def _get_or_create_site_state(self, site_name: str) -> Dict[str, Any]:
+        """
+        Get or create state for a specific site, marking it most recently used.
 
         Args:
             site_name: Name of the site
@@ -150,20 +395,43 @@ class StateManager:
         Returns:
             Site state dictionary
         """
-        if site_name not in self.state["sites"]:
-            self.state["sites"][site_name] = {
-                "last_check_time": None,
-                "last_results": {},
-                "history": {},
-                "statistics": {
-                    "total_checks": 0,
-                    "total_failures": 0,
-                    "consecutive_failures": {},
-                    "last_failure_time": {},
-                    "last_recovery_time": {},
-                },
-            }
-        return self.state["sites"][site_name]
+        sites = self.state["sites"]
+        site_state = sites.get(site_name)
+        if site_state is not None:
+            sites.move_to_end(site_name)
+            return site_state
+
+        site_state = sites[site_name] = {
+            "last_check_time": None,
+            "last_results": {},
+            "history": {},
+            "statistics": {
+                "total_checks": 0,
+                "total_failures": 0,
+                "consecutive_failures": {},
+                "last_failure_time": {},
+                "last_recovery_time": {},
+            },
+        }
+
+        # Bound memory and state file size under unbounded site churn
+        if len(sites) > self.max_sites:
+            evicted, _ = sites.popitem(last=False)
+            self.logger.info(
+                f"Dropped state for least recently checked site '{evicted}'"
+            )
+        return site_state
+
+    def flush(self) -> bool:
+        """
+        Write a full snapshot if state has changed since the last one.
+
+        Returns:
+            True if the state file is up to date
+        """
+        if not self._dirty:
+            return True
+        return self.save_state()
 
     def record_result(self, result: CheckResult, site_name: str = "default"):
         """
@@ -173,31 +441,89 @@ class StateManager:
             result: Check result to record
             site_name: Name of the site being checked
         """
+        self.record_results([(result, site_name)])
+
+    def record_results(self, results: List[Tuple[CheckResult, str]]):
+        """
+        Record several check results with a single state log append.
+
+        The full state file is only rewritten every snapshot_every results,
+        or by flush().
+
+        Args:
+            results: List of (result, site_name) tuples
+        """
+        if not results:
+            return
+
+        # The batch is recorded at one moment; format that time once
+        checked_at = datetime.now()
+        checked_at_iso = checked_at.isoformat()
+
+        lines = []
+        for result, site_name in results:
+            payload = result.to_dict()
+            self._apply_result(result, site_name, checked_at, payload)
+            self._seq += 1
+            lines.append(
+                json.dumps(
+                    {
+                        "seq": self._seq,
+                        "t": checked_at_iso,
+                        "site": site_name,
+                        "result": payload,
+                    },
+                    default=str,
+                )
+            )
+
+        self._append_log(lines)
+        if self._log_entries >= self.snapshot_every:
+            self.save_state()
+
+    def _apply_result(
+        self,
+        result: CheckResult,
+        site_name: str,
+        checked_at: Optional[datetime] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Update in-memory state with a check result (does not save).
+
+        Args:
+            result: Check result to record
+            site_name: Name of the site being checked
+            checked_at: When the result was recorded (default: now)
+            payload: result.to_dict(), if the caller already has it
+        """
         check_type = result.check_type
+        checked_at = checked_at or datetime.now()
+        if payload is None:
+            payload = result.to_dict()
+        self._dirty = True
+        self._generation += 1
 
         # Update global last check time
-        self.state["global"]["last_check_time"] = datetime.now()
+        self.state["global"]["last_check_time"] = checked_at
         self.state["global"]["total_checks"] += 1
 
         # Get site-specific state
-        site_state = self._get_site_state(site_name)
+        site_state = self._get_or_create_site_state(site_name)
 
         # Update site's last check time
-        site_state["last_check_time"] = datetime.now()
-
-        # Store last result
-        site_state["last_results"][check_type] = result.to_dict()
-
-        # Update history
-        if check_type not in site_state["history"]:
-            site_state["history"][check_type] = []
+        site_state["last_check_time"] = checked_at
 
-        history = site_state["history"][check_type]
-        history.append(result.to_dict())
+        # Store last result (the same dict is shared with the history entry)
+        site_state["last_results"][check_type] = payload
 
-        # Trim history to size limit
-        if len(history) > self.history_size:
-            site_state["history"][check_type] = history[-self.history_size :]
+        # Update history (the deque drops the oldest entry once full)
+        history = site_state["history"].get(check_type)
+        if history is None:
+            history = site_state["history"][check_type] = deque(
+                maxlen=self.history_size
+            )
+        history.append(payload)
 
         # Update statistics
         stats = site_state["statistics"]
@@ -212,20 +538,15 @@ class StateManager:
             stats["consecutive_failures"][check_type] += 1
 
             # Record failure time
-            stats["last_failure_time"][check_type] = result.timestamp.isoformat()
+            stats["last_failure_time"][check_type] = result.timestamp
         else:
             # Reset consecutive failures on success
             if check_type in stats["consecutive_failures"]:
                 if stats["consecutive_failures"][check_type] > 0:
                     # This is a recovery
-                    stats["last_recovery_time"][check_type] = (
-                        result.timestamp.isoformat()
-                    )
+                    stats["last_recovery_time"][check_type] = result.timestamp
                 stats["consecutive_failures"][check_type] = 0
 
-        # Auto-save state
-        self.save_state()
-
     def get_last_result(
         self, check_type: str, site_name: str = "default"
     ) -> Optional[Dict[str, Any]]:
@@ -239,7 +560,9 @@ class StateManager:
         Returns:
             Last result dictionary or None
         """
-        site_state = self._get_site_state(site_name)
+        site_state = self._peek_site_state(site_name)
+        if site_state is None:
+            return None
         return site_state["last_results"].get(check_type)
 
     def get_history(
@@ -256,12 +579,12 @@ class StateManager:
         Returns:
             List of recent results
         """
-        site_state = self._get_site_state(site_name)
-        if check_type not in site_state["history"]:
+        site_state = self._peek_site_state(site_name)
+        history = site_state["history"].get(check_type) if site_state else None
+        if not history:
             return []
 
-        history = site_state["history"][check_type]
-        return history[-count:] if history else []
+        return list(islice(history, max(0, len(history) - count), None))
 
     def get_statistics(self, site_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -271,11 +594,14 @@ class StateManager:
             site_name: Name of the site, or None for global statistics
 
         Returns:
-            Statistics dictionary
+            Statistics dictionary (empty for an unknown site), with failure
+            and recovery times as ISO strings
         """
         if site_name:
-            site_state = self._get_site_state(site_name)
-            return site_state["statistics"].copy()
+            site_state = self._peek_site_state(site_name)
+            if site_state is None:
+                return {}
+            return self._summary_statistics(site_state["statistics"])
         else:
             # Return global statistics
             return self.state["global"].copy()
@@ -293,7 +619,9 @@ class StateManager:
         Returns:
             Number of consecutive failures
         """
-        site_state = self._get_site_state(site_name)
+        site_state = self._peek_site_state(site_name)
+        if site_state is None:
+            return 0
         return site_state["statistics"]["consecutive_failures"].get(check_type, 0)
 
     def is_recovering(self, check_type: str, site_name: str = "default") -> bool:
@@ -307,7 +635,9 @@ class StateManager:
         Returns:
             True if recovering
         """
-        site_state = self._get_site_state(site_name)
+        site_state = self._peek_site_state(site_name)
+        if site_state is None:
+            return False
         stats = site_state["statistics"]
 
         last_failure = stats["last_failure_time"].get(check_type)
@@ -339,46 +669,83 @@ class StateManager:
             site_name: Name of the site, or None for all sites
 
         Returns:
-            Summary dictionary
+            Summary dictionary (empty for an unknown site). The all-sites
+            summary is cached until the state changes and shared between
+            callers, so it must not be modified.
         """
         if site_name:
-            # Single site summary
-            site_state = self._get_site_state(site_name)
-            summary = {
-                "site_name": site_name,
-                "last_check": site_state["last_check_time"].isoformat()
-                if site_state["last_check_time"]
-                else None,
-                "statistics": site_state["statistics"].copy(),
-                "current_status": {},
-            }
-
-            # Add current status for each check type
-            for check_type, result in site_state["last_results"].items():
-                summary["current_status"][check_type] = {
+            site_state = self._peek_site_state(site_name)
+            if site_state is None:
+                return {}
+            return self._summary_for(site_name, site_state)
+
+        # All sites summary, rebuilt only after the state has changed
+        if self._summary_cache and self._summary_cache[0] == self._generation:
+            return self._summary_cache[1]
+
+        last_check = self.state["global"].get("last_check_time")
+        summary = {
+            "global": {
+                **self.state["global"],
+                "last_check_time": last_check.isoformat() if last_check else None,
+            },
+            "sites": {
+                site: self._summary_for(site, site_state)
+                for site, site_state in self.state["sites"].items()
+            },
+        }
+
+        self._summary_cache = (self._generation, summary)
+        return summary
+
+    def _summary_for(
+        self, site_name: str, site_state: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build the summary of one site in a single pass over its state.
+
+        Args:
+            site_name: Name of the site
+            site_state: State dictionary of the site
+
+        Returns:
+            Site summary dictionary
+        """
+        last_check = site_state["last_check_time"]
+        return {
+            "site_name": site_name,
+            "last_check": last_check.isoformat() if last_check else None,
+            "statistics": self._summary_statistics(site_state["statistics"]),
+            "current_status": {
+                check_type: {
                     "status": result.get("status"),
                     "success": result.get("success"),
                     "last_checked": result.get("timestamp"),
                     "response_time_ms": result.get("response_time_ms"),
                 }
+                for check_type, result in site_state["last_results"].items()
+            },
+        }
 
-            return summary
-        else:
-            # All sites summary
-            summary = {
-                "global": self.state["global"].copy(),
-                "sites": {},
-            }
-
-            if summary["global"].get("last_check_time"):
-                summary["global"]["last_check_time"] = summary["global"][
-                    "last_check_time"
-                ].isoformat()
+    @staticmethod
+    def _summary_statistics(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy site statistics for a summary, with times as ISO strings.
 
-            for site in self.get_all_sites():
-                summary["sites"][site] = self.get_summary(site)
+        Args:
+            stats: Site statistics dictionary
 
-            return summary
+        Returns:
+            Statistics dictionary that shares no mutable state with the site
+        """
+        return {
+            key: {check_type: ts.isoformat() for check_type, ts in value.items()}
+            if key in _STAT_TIME_KEYS
+            else dict(value)
+            if isinstance(value, dict)
+            else value
+            for key, value in stats.items()
+        }
 
     def clear_history(
         self, check_type: Optional[str] = None, site_name: Optional[str] = None
@@ -392,10 +759,13 @@ class StateManager:
         """
         if site_name:
             # Clear specific site
-            site_state = self._get_site_state(site_name)
+            site_state = self._peek_site_state(site_name)
+            if site_state is None:
+                return  # Nothing recorded for this site
+            self._generation += 1
             if check_type:
                 if check_type in site_state["history"]:
-                    site_state["history"][check_type] = []
+                    site_state["history"][check_type].clear()
                     self.logger.info(f"Cleared history for {check_type} on {site_name}")
             else:
                 site_state["history"] = {}
@@ -430,22 +800,3 @@ class StateManager:
             )
 
         self.logger.info(f"Migrated old state to site '{site_name}'")
-
-    def _prepare_for_serialization(self, obj: Any) -> Any:
-        """
-        Prepare object for JSON serialization.
-
-        Args:
-            obj: Object to prepare
-
-        Returns:
-            Serializable version of object
-        """
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            return {k: self._prepare_for_serialization(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._prepare_for_serialization(item) for item in obj]
-        else:
-            return obj
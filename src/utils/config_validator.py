@@ -1,13 +1,48 @@
 """Configuration validation utilities to prevent SSRF and misconfigurations."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set, Union
 from urllib.parse import urlparse
 import ipaddress
 import socket
 
 logger = logging.getLogger(__name__)
 
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+
+_ALLOWED_SCHEMES = frozenset({"http", "https"})
+_CHECK_TYPES = ("uptime", "authentication", "health")
+_VALID_CHECKS = frozenset(_CHECK_TYPES)
+_VALID_CHECKS_STR = ", ".join(_CHECK_TYPES)
+_LOCALHOST_NAMES = frozenset({"localhost", "127.0.0.1", "::1", "0.0.0.0"})
+_METADATA_HOSTS = frozenset(
+    {"169.254.169.254", "metadata.google.internal", "metadata", "instance-data"}
+)
+
+
+def _parse_ip(hostname: str) -> Optional[IPAddress]:
+    """
+    Parse a URL hostname as an IP address.
+
+    Besides the canonical forms, this accepts a trailing dot and the legacy
+    IPv4 spellings that resolvers still honour (e.g. ``10.1`` or ``0xa000001``).
+
+    Args:
+        hostname: Lowercased hostname from the URL
+
+    Returns:
+        The IP address, or None if the hostname is not an IP literal
+    """
+    host = hostname.strip("[]").rstrip(".")
+    try:
+        return ipaddress.ip_address(host)
+    except ValueError:
+        pass
+    try:
+        return ipaddress.IPv4Address(socket.inet_aton(host))
+    except OSError:
+        return None
+
 
 class ConfigValidationError(Exception):
     """Exception raised when configuration validation fails."""
@@ -38,7 +73,7 @@ class ConfigValidator:
             raise ConfigValidationError(f"{field_name}: Failed to parse URL: {e}")
 
         # Check scheme
-        if parsed.scheme not in ["http", "https"]:
+        if parsed.scheme not in _ALLOWED_SCHEMES:
             raise ConfigValidationError(
                 f"{field_name}: Invalid URL scheme '{parsed.scheme}'. "
                 f"Only http and https are allowed."
@@ -51,13 +86,13 @@ class ConfigValidator:
         hostname = parsed.hostname.lower()
 
         # Block localhost
-        if hostname in ["localhost", "127.0.0.1", "::1", "0.0.0.0"] or hostname.startswith("127."):
+        if hostname in _LOCALHOST_NAMES or hostname.startswith("127."):
             raise ConfigValidationError(
                 f"{field_name}: Localhost addresses are not allowed: {hostname}"
             )
 
         # Block cloud metadata
-        if hostname in ["169.254.169.254", "metadata.google.internal", "metadata", "instance-data"]:
+        if hostname in _METADATA_HOSTS:
             raise ConfigValidationError(
                 f"{field_name}: Cloud metadata endpoints are not allowed: {hostname}"
             )
@@ -67,27 +102,15 @@ class ConfigValidator:
                 f"{field_name}: Cloud metadata IP range (169.254.x.x) is not allowed"
             )
 
-        # Check if it's an IP address
-        try:
-            ip = ipaddress.ip_address(hostname.strip("[]"))
-            if ip.is_private or ip.is_loopback or ip.is_link_local:
-                raise ConfigValidationError(
-                    f"{field_name}: Private/internal IP addresses are not allowed: {ip}"
-                )
-        except ValueError:
-            # It's a hostname, check for private IP prefixes
-            private_prefixes = [
-                "10.", "172.16.", "172.17.", "172.18.", "172.19.",
-                "172.20.", "172.21.", "172.22.", "172.23.", "172.24.",
-                "172.25.", "172.26.", "172.27.", "172.28.", "172.29.",
-                "172.30.", "172.31.", "192.168."
-            ]
-            if any(hostname.startswith(prefix) for prefix in private_prefixes):
-                raise ConfigValidationError(
-                    f"{field_name}: Private IP ranges are not allowed: {hostname}"
-                )
+        # Check IP addresses against the private, loopback and link-local
+        # networks; plain hostnames are left to DNS validation in the checkers
+        ip = _parse_ip(hostname)
+        if ip is not None and (ip.is_private or ip.is_loopback or ip.is_link_local):
+            raise ConfigValidationError(
+                f"{field_name}: Private/internal IP addresses are not allowed: {ip}"
+            )
 
-        logger.debug(f"URL validation passed for {field_name}: {url}")
+        logger.debug("URL validation passed for %s: %s", field_name, url)
 
     @staticmethod
     def validate_site_config(site: Dict[str, Any], site_index: int) -> None:
@@ -124,12 +147,11 @@ class ConfigValidator:
                     f"{site_id}: 'checks_enabled' must be a list"
                 )
 
-            valid_checks = ["uptime", "authentication", "health"]
             for check in checks:
-                if check not in valid_checks:
+                if check not in _VALID_CHECKS:
                     raise ConfigValidationError(
                         f"{site_id}: Invalid check type '{check}'. "
-                        f"Valid types: {', '.join(valid_checks)}"
+                        f"Valid types: {_VALID_CHECKS_STR}"
                     )
 
         # Validate authentication config if present
@@ -148,7 +170,7 @@ class ConfigValidator:
                         f"{site_id}.authentication.login_endpoint must be a string"
                     )
 
-        logger.debug(f"Site configuration validated: {site_name}")
+        logger.debug("Site configuration validated: %s", site_name)
 
     @staticmethod
     def validate_config(config: Dict[str, Any]) -> List[str]:
@@ -178,7 +200,7 @@ class ConfigValidator:
             raise ConfigValidationError("At least one site must be configured")
 
         # Check for duplicate site names
-        site_names = []
+        site_names: Set[str] = set()
         for i, site in enumerate(sites):
             if not isinstance(site, dict):
                 raise ConfigValidationError(f"sites[{i}]: Each site must be a dictionary")
@@ -192,7 +214,7 @@ class ConfigValidator:
                 raise ConfigValidationError(
                     f"Duplicate site name: '{name}'. Site names must be unique."
                 )
-            site_names.append(name)
+            site_names.add(name)
 
         # Validate monitoring configuration
         if "monitoring" in config:
@@ -19,8 +19,11 @@ This operates as a "dead man's switch" - continuous heartbeats indicate
 the monitor is alive. If heartbeats stop, you get alerted.
 """
 
+import atexit
 import logging
-from typing import Optional
+import queue
+import threading
+from typing import Optional, Tuple
 
 import httpx
 
@@ -31,8 +34,16 @@ class HealthcheckMonitor:
 
     This sends heartbeat pings to Healthchecks.io to ensure the monitor
     is running and performing checks. If pings stop, you get notified.
+
+    Pings are advisory, so they are sent from a background thread and never
+    hold up a check cycle; only the final exit ping is sent synchronously.
+    Queued pings are still sent at interpreter exit, so one-shot runs (e.g.
+    ``--check-once`` from cron) do not lose their heartbeat.
     """
 
+    # Pending pings kept while hc-ping.com is slow; older ones are dropped
+    MAX_PENDING_PINGS = 32
+
     def __init__(self, ping_url: Optional[str] = None, enabled: bool = True):
         """
         Initialize healthcheck monitor.
@@ -48,9 +59,24 @@ class HealthcheckMonitor:
             raise ValueError("HEALTHCHECK_PING_URL is not configured!")
 
         self.ping_url = ping_url
+        self._base_url = ping_url.rstrip("/")
         self.enabled = enabled
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # Persistent client so pings share one SSL context and, when pings
+        # are close together, one keep-alive connection; released by close()
+        self._client = httpx.Client(
+            timeout=5.0,  # Short, since this is just a heartbeat
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=1),
+        )
+
+        self._queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue(
+            maxsize=self.MAX_PENDING_PINGS
+        )
+        self._queue_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
     def ping_start(self) -> bool:
         """
         Send a 'start' signal to indicate monitor is starting.
@@ -59,12 +85,12 @@ class HealthcheckMonitor:
         after a crash.
 
         Returns:
-            True if ping sent successfully
+            True if ping was queued
         """
         if not self.enabled:
             return False
 
-        return self._send_ping("/start", "Monitor starting")
+        return self._enqueue("/start", "Monitor starting")
 
     def ping_success(self, message: str = None) -> bool:
         """
@@ -78,12 +104,12 @@ class HealthcheckMonitor:
             message: Optional message to include (e.g., "Checked 5 sites")
 
         Returns:
-            True if ping sent successfully
+            True if ping was queued
         """
         if not self.enabled:
             return False
 
-        return self._send_ping("", message or "Check cycle completed")
+        return self._enqueue("", message or "Check cycle completed")
 
     def ping_fail(self, message: str = None) -> bool:
         """
@@ -96,12 +122,12 @@ class HealthcheckMonitor:
             message: Optional failure message
 
         Returns:
-            True if ping sent successfully
+            True if ping was queued
         """
         if not self.enabled:
             return False
 
-        return self._send_ping("/fail", message or "Check cycle failed")
+        return self._enqueue("/fail", message or "Check cycle failed")
 
     def ping_exit(self, exit_status: int = 0, message: str = None) -> bool:
         """
@@ -109,7 +135,8 @@ class HealthcheckMonitor:
 
         This reports the script's exit status (0-255 integer). Healthchecks.io
         interprets 0 as success and all other values as failure. Use this for
-        graceful shutdowns to avoid false alerts.
+        graceful shutdowns to avoid false alerts. Pending pings are sent
+        first, so the exit status is always the last signal.
 
         Args:
             exit_status: Exit code (0 = success, 1-255 = failure)
@@ -127,8 +154,59 @@ class HealthcheckMonitor:
             )
             exit_status = 1
 
+        self.flush()
         return self._send_ping(f"/{exit_status}", message or "Monitor shutting down")
 
+    def flush(self) -> None:
+        """Block until all queued pings have been sent."""
+        if self._worker is not None:
+            self._queue.join()
+
+    def _enqueue(self, suffix: str, message: str) -> bool:
+        """
+        Queue a ping for the background sender.
+
+        Args:
+            suffix: URL suffix passed to _send_ping
+            message: Message to include in ping body
+
+        Returns:
+            True if ping was queued
+        """
+        with self._queue_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="healthcheck-pinger", daemon=True
+                )
+                self._worker.start()
+                # The worker is a daemon thread; drain it before the
+                # interpreter exits even if close() is never called
+                atexit.register(self.close)
+
+            try:
+                self._queue.put_nowait((suffix, message))
+            except queue.Full:
+                # Stale heartbeats are worthless; make room by dropping the oldest
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    pass
+                self.logger.warning("Healthcheck ping queue full, dropped oldest ping")
+                self._queue.put_nowait((suffix, message))
+        return True
+
+    def _run_worker(self) -> None:
+        """Send queued pings until close() posts the stop sentinel."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._send_ping(*item)
+            finally:
+                self._queue.task_done()
+
     def _send_ping(self, suffix: str = "", message: str = None) -> bool:
         """
         Send ping to Healthchecks.io.
@@ -143,19 +221,16 @@ class HealthcheckMonitor:
         if not self.ping_url:
             return False
 
-        url = f"{self.ping_url.rstrip('/')}{suffix}"
+        url = f"{self._base_url}{suffix}"
 
         try:
             # Send ping with optional message body
-            # Timeout is short (5s) since this is just a heartbeat
-            response = httpx.post(
-                url,
-                data=message.encode("utf-8") if message else None,
-                timeout=5.0,
+            response = self._client.post(
+                url, content=message.encode("utf-8") if message else None
             )
             response.raise_for_status()
 
-            self.logger.debug(f"Healthcheck ping sent: {suffix or 'success'}")
+            self.logger.debug("Healthcheck ping sent: %s", suffix or "success")
             return True
 
         except httpx.HTTPStatusError as e:
@@ -170,6 +245,16 @@ class HealthcheckMonitor:
             self.logger.error(f"Unexpected error sending healthcheck ping: {str(e)}")
             return False
 
+    def close(self) -> None:
+        """Send pending pings, stop the background sender and close the client."""
+        with self._queue_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            atexit.unregister(self.close)
+            self._queue.put(None)
+            worker.join()
+        self._client.close()
+
 
 def create_healthcheck_monitor(
     ping_url: Optional[str] = None, enabled: bool = True
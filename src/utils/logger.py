@@ -1,11 +1,94 @@
 """Logging configuration and utilities."""
 
+import atexit
+import copy
+import json
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
-import coloredlogs
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Listener thread that owns the log file handlers (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Write out queued records, stop the listener and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+# Runs before logging's own shutdown hook, so queued records reach the files
+atexit.register(_stop_queue_listener)
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves exception formatting to the file handlers."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for the queue.
+
+        The stock QueueHandler formats the record here, folding the traceback
+        into ``msg`` and dropping ``exc_info``, so formatters behind the
+        listener (e.g. JsonFormatter) can no longer tell them apart. Only the
+        message arguments are merged, in the logging thread, since they may
+        be mutable; exception details are passed through unchanged.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            Copy of the record with its message arguments merged
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter that writes each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as JSON.
+
+        The timestamp is the raw ``record.created`` epoch float, so no
+        strftime runs per record; readers format it for display.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            JSON line for the record
+        """
+        entry = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(entry).decode("utf-8")
+        return json.dumps(entry, ensure_ascii=False)
 
 
 def setup_logging(
@@ -22,6 +105,8 @@ def setup_logging(
     Returns:
         Configured root logger
     """
+    global _queue_listener
+
     if config is None:
         config = {}
 
@@ -38,12 +123,16 @@ def setup_logging(
     root_logger.setLevel(getattr(logging, level))
 
     # Clear any existing handlers
+    _stop_queue_listener()
     root_logger.handlers = []
 
     # Console handler with colored output
     if console:
         if sys.stdout.isatty():
-            # Use colored logs if in terminal
+            # Use colored logs if in terminal; imported here so cron and CI
+            # runs never pay for coloredlogs and humanfriendly
+            import coloredlogs
+
             coloredlogs.install(
                 level=level,
                 fmt=log_format,
@@ -92,9 +181,11 @@ def setup_logging(
             encoding="utf-8",
         )
         file_handler.setLevel(getattr(logging, main_log_level))
-        file_formatter = logging.Formatter(log_format, datefmt=date_format)
+        if log_config.get("json", False):
+            file_formatter = JsonFormatter()
+        else:
+            file_formatter = logging.Formatter(log_format, datefmt=date_format)
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
 
         # Error log file (warnings and errors)
         error_file_path = log_config.get("error_file_path", "./logs/monitor.error.log")
@@ -109,7 +200,15 @@ def setup_logging(
         )
         error_handler.setLevel(getattr(logging, error_log_level))
         error_handler.setFormatter(file_formatter)
-        root_logger.addHandler(error_handler)
+
+        # Write log files from a listener thread so check threads never
+        # block on disk I/O; the root logger only enqueues records
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        root_logger.addHandler(_RecordQueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
 
     # Log initial message
     root_logger.info("Logging configured successfully")
@@ -134,12 +233,29 @@ def get_logger(name: str) -> logging.Logger:
 class LoggerAdapter(logging.LoggerAdapter):
     """Custom logger adapter for adding context to log messages."""
 
+    def __init__(self, logger: logging.Logger, extra: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the adapter and build its context prefix.
+
+        Args:
+            logger: Logger to wrap
+            extra: Context variables to add to all log messages
+        """
+        super().__init__(logger, extra)
+        self.refresh_prefix()
+
+    def refresh_prefix(self) -> None:
+        """Rebuild the context prefix after ``extra`` has been changed."""
+        if self.extra:
+            context_items = ", ".join(f"{k}={v}" for k, v in self.extra.items())
+            self._prefix = f"[{context_items}] "
+        else:
+            self._prefix = ""
+
     def process(self, msg, kwargs):
         """Add context to log messages."""
-        # Add any context from extra dict
-        if self.extra:
-            context_items = [f"{k}={v}" for k, v in self.extra.items()]
-            msg = f"[{', '.join(context_items)}] {msg}"
+        if self._prefix:
+            msg = f"{self._prefix}{msg}"
         return msg, kwargs
 
 
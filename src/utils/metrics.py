@@ -29,6 +29,11 @@ class MetricsCollector:
         self.check_count = 0
         self.failure_count = 0
 
+        # Per-metric statistics are memoized until the next recorded value
+        self._version = 0
+        self._stats_cache_version = -1
+        self._stats_cache: Dict[str, Dict[str, Any]] = {}
+
     def record_metric(
         self, name: str, value: float, timestamp: Optional[datetime] = None
     ):
@@ -44,6 +49,7 @@ class MetricsCollector:
             timestamp = datetime.now()
 
         self.metrics[name].append({"value": value, "timestamp": timestamp})
+        self._version += 1
 
         self.logger.debug(f"Recorded metric {name}: {value}")
 
@@ -202,16 +208,24 @@ class MetricsCollector:
         Returns:
             Dictionary with all metrics summaries
         """
-        summary = {"availability": self.get_availability(), "metrics": {}}
-
-        for metric_name in self.metrics:
-            summary["metrics"][metric_name] = self.get_statistics(metric_name)
+        # Availability depends on the current time, so it is always fresh;
+        # metric statistics only change when a new value is recorded
+        if self._stats_cache_version != self._version:
+            self._stats_cache = {
+                metric_name: self.get_statistics(metric_name)
+                for metric_name in self.metrics
+            }
+            self._stats_cache_version = self._version
 
-        return summary
+        return {
+            "availability": self.get_availability(),
+            "metrics": dict(self._stats_cache),
+        }
 
     def reset(self):
         """Reset all metrics."""
         self.metrics.clear()
+        self._version += 1
         self.uptime_start = None
         self.downtime_start = None
         self.total_uptime = timedelta()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for CredentialManager lookups.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage import CredentialManager
+from src.storage.credential_manager import _first_regular_file
+
+
+class TestCredentialCache(unittest.TestCase):
+    """Test that credential lookups are cached per manager."""
+
+    def setUp(self):
+        """Create a manager using environment variables only."""
+        self.env = patch.dict(os.environ, {"ENVIRONMENT": "test"})
+        self.env.start()
+        self.manager = CredentialManager()
+
+    def tearDown(self):
+        """Restore the environment."""
+        self.env.stop()
+
+    def test_lookup_is_cached(self):
+        """Test that a key is read from the environment only once."""
+        os.environ["TEST_CM_TOKEN"] = "abc"
+
+        with patch.object(
+            CredentialManager,
+            "_lookup_credential",
+            autospec=True,
+            side_effect=CredentialManager._lookup_credential,
+        ) as mock_lookup:
+            self.assertEqual(self.manager.get_credential("TEST_CM_TOKEN"), "abc")
+            self.assertEqual(self.manager.get_credential("TEST_CM_TOKEN"), "abc")
+
+        mock_lookup.assert_called_once_with(self.manager, "TEST_CM_TOKEN")
+
+    def test_missing_key_returns_default(self):
+        """Test that defaults apply to missing keys, including cached misses."""
+        os.environ.pop("TEST_CM_MISSING", None)
+
+        self.assertIsNone(self.manager.get_credential("TEST_CM_MISSING"))
+        self.assertEqual(
+            self.manager.get_credential("TEST_CM_MISSING", "fallback"), "fallback"
+        )
+
+    def test_invalidate_rereads_value(self):
+        """Test that invalidate() forces a fresh lookup."""
+        os.environ["TEST_CM_TOKEN"] = "old"
+        self.assertEqual(self.manager.get_credential("TEST_CM_TOKEN"), "old")
+
+        os.environ["TEST_CM_TOKEN"] = "new"
+        self.assertEqual(self.manager.get_credential("TEST_CM_TOKEN"), "old")
+
+        self.manager.invalidate("TEST_CM_TOKEN")
+        self.assertEqual(self.manager.get_credential("TEST_CM_TOKEN"), "new")
+
+    def test_keyring_not_imported_outside_production(self):
+        """Test that the keyring module is only loaded when it will be used."""
+        with patch("src.storage.credential_manager._get_keyring") as mock_get:
+            manager = CredentialManager()
+
+        mock_get.assert_not_called()
+        self.assertFalse(manager.use_keyring)
+
+    def test_no_instance_dict(self):
+        """Test that instances use __slots__ instead of a per-instance dict."""
+        self.assertFalse(hasattr(self.manager, "__dict__"))
+
+
+class TestCredentialBundles(unittest.TestCase):
+    """Test cached credential bundles."""
+
+    def setUp(self):
+        """Create a manager with site and email credentials in the environment."""
+        self.env = patch.dict(
+            os.environ,
+            {
+                "ENVIRONMENT": "test",
+                "TESTSITE_USERNAME": "alice",
+                "TESTSITE_PASSWORD": "secret",
+                "EMAIL_FROM": "monitor@example.com",
+            },
+        )
+        self.env.start()
+        self.manager = CredentialManager()
+
+    def tearDown(self):
+        """Restore the environment."""
+        self.env.stop()
+
+    def test_site_bundle_is_cached_and_read_only(self):
+        """Test that repeated calls return the same read-only mapping."""
+        first = self.manager.get_credentials_by_key("testsite")
+        second = self.manager.get_credentials_by_key("TestSite")
+
+        self.assertIs(first, second)
+        self.assertEqual(dict(first), {"username": "alice", "password": "secret"})
+        with self.assertRaises(TypeError):
+            first["username"] = "mallory"
+
+    def test_email_credentials_return_mutable_copy(self):
+        """Test that callers may adjust their copy of the email settings."""
+        email = self.manager.get_email_credentials()
+        email["smtp_server"] = "smtp.example.com"
+
+        self.assertEqual(
+            self.manager.get_email_credentials()["smtp_server"], "smtp.gmail.com"
+        )
+        self.assertEqual(email["from_address"], "monitor@example.com")
+
+    def test_refresh_reloads_bundles(self):
+        """Test that refresh() picks up changed credentials."""
+        self.manager.get_credentials_by_key("testsite")
+        os.environ["TESTSITE_PASSWORD"] = "rotated"
+
+        self.manager.refresh()
+
+        self.assertEqual(
+            self.manager.get_credentials_by_key("testsite")["password"], "rotated"
+        )
+
+
+    def test_bundle_uses_one_keyring_search(self):
+        """Test that a bundle's keys come from a single keyring query."""
+        self.manager.use_keyring = True
+
+        with patch.object(
+            CredentialManager,
+            "_search_keyring",
+            return_value={"TESTSITE_PASSWORD": "from-keyring"},
+        ) as mock_search, patch(
+            "src.storage.credential_manager._get_keyring"
+        ) as mock_get_keyring:
+            bundle = self.manager.get_credentials_by_key("testsite")
+
+        mock_search.assert_called_once()
+        mock_get_keyring.return_value.get_password.assert_not_called()
+        self.assertEqual(
+            dict(bundle), {"username": "alice", "password": "from-keyring"}
+        )
+
+    def test_bundle_falls_back_to_per_key_lookup(self):
+        """Test that backends without search are queried key by key."""
+        self.manager.use_keyring = True
+
+        with patch.object(
+            CredentialManager, "_search_keyring", return_value=None
+        ), patch(
+            "src.storage.credential_manager._get_keyring"
+        ) as mock_get_keyring:
+            mock_get_keyring.return_value.get_password.return_value = None
+            bundle = self.manager.get_credentials_by_key("testsite")
+
+        self.assertEqual(mock_get_keyring.return_value.get_password.call_count, 2)
+        self.assertEqual(dict(bundle), {"username": "alice", "password": "secret"})
+
+
+class TestEnvFileLookup(unittest.TestCase):
+    """Test locating the .env file."""
+
+    def test_first_regular_file_skips_missing_and_directories(self):
+        """Test that only existing regular files are returned."""
+        with tempfile.TemporaryDirectory() as tmp:
+            env_file = Path(tmp) / ".env"
+            env_file.write_text("TEST_CM_TOKEN=abc\n")
+
+            self.assertEqual(
+                _first_regular_file([Path(tmp) / "missing", tmp, env_file]),
+                env_file,
+            )
+            self.assertIsNone(_first_regular_file([Path(tmp) / "missing", tmp]))
+
+
+class TestMaskCredential(unittest.TestCase):
+    """Test credential masking for logs."""
+
+    def setUp(self):
+        """Create a manager."""
+        self.manager = CredentialManager()
+
+    def test_mask_keeps_prefix(self):
+        """Test that only the first characters stay visible."""
+        self.assertEqual(self.manager.mask_credential("username"), "use*****")
+        self.assertEqual(self.manager.mask_credential("username", 1), "u*******")
+
+    def test_mask_short_and_empty_values(self):
+        """Test that short values are fully masked and empty ones stay empty."""
+        self.assertEqual(self.manager.mask_credential("abc"), "***")
+        self.assertEqual(self.manager.mask_credential(""), "")
+        self.assertEqual(self.manager.mask_credential(None), "")
+
+    def test_mask_long_value(self):
+        """Test that values longer than the precomputed mask are handled."""
+        value = "x" * 300
+        self.assertEqual(self.manager.mask_credential(value), "xxx" + "*" * 297)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Tests for EmailNotifier SMTP connection handling.
+"""
+
+import smtplib
+import ssl
+import sys
+import unittest
+from pathlib import Path
+from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.checkers import CheckResult, CheckStatus
+from src.notifiers.email_notifier import EmailNotifier
+
+
+class TestEmailNotifierConnectionReuse(unittest.TestCase):
+    """Test that EmailNotifier keeps one SMTP session across sends."""
+
+    def setUp(self):
+        """Set up test configuration."""
+        self.config = {
+            "notifications": {
+                "email": {
+                    "enabled": True,
+                    "smtp_server": "smtp.example.com",
+                    "smtp_port": 587,
+                    "to_addresses": ["ops@example.com"],
+                    "max_messages_per_connection": 2,
+                }
+            }
+        }
+
+        # Mock credential manager
+        self.mock_cred_manager = Mock()
+        self.mock_cred_manager.get_email_credentials.return_value = {
+            "from_address": "monitor@example.com",
+            "to_address": "ops@example.com",
+            "password": "secret",
+            "smtp_server": "smtp.example.com",
+            "smtp_port": 587,
+        }
+
+    def _make_server(self):
+        """Create a mock SMTP session that answers NOOP."""
+        server = MagicMock()
+        server.noop.return_value = (250, b"OK")
+        return server
+
+    @patch("smtplib.SMTP")
+    def test_connection_reused_between_sends(self, mock_smtp_class):
+        """Test that consecutive emails share one connection and login."""
+        server = self._make_server()
+        mock_smtp_class.return_value = server
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        self.assertTrue(notifier._send_email("one", "<p>1</p>", "1"))
+        self.assertTrue(notifier._send_email("two", "<p>2</p>", "2"))
+
+        mock_smtp_class.assert_called_once_with("smtp.example.com", 587)
+        server.login.assert_called_once()
+        self.assertEqual(server.send_message.call_count, 2)
+
+    @patch("smtplib.SMTP")
+    def test_reconnects_after_message_limit(self, mock_smtp_class):
+        """Test that max_messages_per_connection forces a new session."""
+        first, second = self._make_server(), self._make_server()
+        mock_smtp_class.side_effect = [first, second]
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        for i in range(3):
+            notifier._send_email(f"msg {i}", "<p>x</p>", "x")
+
+        self.assertEqual(mock_smtp_class.call_count, 2)
+        first.quit.assert_called_once()
+        second.send_message.assert_called_once()
+
+    @patch("smtplib.SMTP")
+    def test_reconnects_when_noop_fails(self, mock_smtp_class):
+        """Test that a dropped connection is replaced on the next send."""
+        first, second = self._make_server(), self._make_server()
+        first.noop.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp_class.side_effect = [first, second]
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        notifier._send_email("one", "<p>1</p>", "1")
+        notifier._send_email("two", "<p>2</p>", "2")
+
+        self.assertEqual(mock_smtp_class.call_count, 2)
+        second.send_message.assert_called_once()
+
+    @patch("smtplib.SMTP")
+    def test_starttls_uses_shared_context(self, mock_smtp_class):
+        """Test that STARTTLS reuses the SSL context built at init."""
+        server = self._make_server()
+        mock_smtp_class.return_value = server
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        notifier._send_email("one", "<p>1</p>", "1")
+
+        self.assertIsNotNone(notifier._ssl_ctx)
+        server.starttls.assert_called_once_with(context=notifier._ssl_ctx)
+
+    def test_tls_not_verified_by_default(self):
+        """Test that the default STARTTLS context matches smtplib's own."""
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        self.assertEqual(notifier._ssl_ctx.verify_mode, ssl.CERT_NONE)
+        self.assertFalse(notifier._ssl_ctx.check_hostname)
+
+    @patch("ssl.create_default_context")
+    def test_verify_tls_checks_certificate(self, mock_create_context):
+        """Test that verify_tls builds a verifying context with ca_file."""
+        self.config["notifications"]["email"]["verify_tls"] = True
+        self.config["notifications"]["email"]["ca_file"] = "/etc/ssl/relay-ca.pem"
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        mock_create_context.assert_called_once_with(cafile="/etc/ssl/relay-ca.pem")
+        self.assertIs(notifier._ssl_ctx, mock_create_context.return_value)
+
+    def test_verify_tls_uses_system_store_without_ca_file(self):
+        """Test that verify_tls without ca_file verifies against the system store."""
+        self.config["notifications"]["email"]["verify_tls"] = True
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        self.assertEqual(notifier._ssl_ctx.verify_mode, ssl.CERT_REQUIRED)
+        self.assertTrue(notifier._ssl_ctx.check_hostname)
+
+    @patch("smtplib.SMTP")
+    def test_close_quits_session(self, mock_smtp_class):
+        """Test that close() ends the SMTP session."""
+        server = self._make_server()
+        mock_smtp_class.return_value = server
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        notifier._send_email("one", "<p>1</p>", "1")
+        notifier.close()
+
+        server.quit.assert_called_once()
+        self.assertIsNone(notifier._smtp)
+
+    @patch("smtplib.SMTP")
+    def test_context_manager_closes_session(self, mock_smtp_class):
+        """Test that leaving a with-block ends the SMTP session."""
+        server = self._make_server()
+        mock_smtp_class.return_value = server
+
+        with EmailNotifier(self.config, self.mock_cred_manager) as notifier:
+            notifier._send_email("one", "<p>1</p>", "1")
+
+        server.quit.assert_called_once()
+
+    @patch("smtplib.SMTP")
+    def test_message_has_text_and_html_parts(self, mock_smtp_class):
+        """Test that the sent message is multipart/alternative with both bodies."""
+        server = self._make_server()
+        mock_smtp_class.return_value = server
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        notifier._send_email("Alert\r\nBcc: x@example.com", "<p>html</p>", "text")
+
+        msg = server.send_message.call_args.args[0]
+        self.assertEqual(msg["Subject"], "AlertBcc: x@example.com")
+        self.assertEqual(msg["From"], "monitor@example.com")
+        self.assertEqual(msg["To"], "ops@example.com")
+        self.assertEqual(msg.get_content_type(), "multipart/alternative")
+        self.assertEqual(
+            [part.get_content_type() for part in msg.iter_parts()],
+            ["text/plain", "text/html"],
+        )
+
+    @patch("smtplib.SMTP")
+    def test_text_only_skips_html(self, mock_smtp_class):
+        """Test that html: false sends a plain text email without an HTML body."""
+        server = self._make_server()
+        mock_smtp_class.return_value = server
+        self.config["notifications"]["email"]["html"] = False
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+        result = CheckResult(
+            check_type="uptime",
+            timestamp=datetime.now(),
+            status=CheckStatus.FAILURE,
+            success=False,
+            error_message="down",
+        )
+
+        with patch.object(notifier, "_create_html_email") as mock_html:
+            self.assertTrue(notifier.notify(result, site_name="Site A"))
+
+        mock_html.assert_not_called()
+        msg = server.send_message.call_args.args[0]
+        self.assertEqual(msg.get_content_type(), "text/plain")
+
+    @patch("smtplib.SMTP")
+    def test_separate_recipients_share_session(self, mock_smtp_class):
+        """Test that per-recipient messages go out over one session with RSET."""
+        server = self._make_server()
+        mock_smtp_class.return_value = server
+        self.config["notifications"]["email"]["separate_recipients"] = True
+        self.config["notifications"]["email"]["max_messages_per_connection"] = 100
+        self.config["notifications"]["email"]["to_addresses"] = [
+            "a@example.com",
+            "b@example.com",
+            "c@example.com",
+        ]
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        self.assertTrue(notifier._send_email("one", "<p>1</p>", "1"))
+
+        mock_smtp_class.assert_called_once()
+        self.assertEqual(server.send_message.call_count, 3)
+        self.assertEqual(server.rset.call_count, 2)
+        recipients = [c.args[0]["To"] for c in server.send_message.call_args_list]
+        self.assertEqual(
+            recipients, ["a@example.com", "b@example.com", "c@example.com"]
+        )
+
+    @patch("smtplib.SMTP")
+    def test_reconnects_when_rset_fails(self, mock_smtp_class):
+        """Test that a server closing the session on RSET is reconnected."""
+        first, second = self._make_server(), self._make_server()
+        first.rset.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp_class.side_effect = [first, second]
+        self.config["notifications"]["email"]["separate_recipients"] = True
+        self.config["notifications"]["email"]["to_addresses"] = [
+            "a@example.com",
+            "b@example.com",
+        ]
+        notifier = EmailNotifier(self.config, self.mock_cred_manager)
+
+        self.assertTrue(notifier._send_email("one", "<p>1</p>", "1"))
+
+        first.send_message.assert_called_once()
+        second.send_message.assert_called_once()
+
+
+class TestEmailNotifierContent(unittest.TestCase):
+    """Test rendering of email bodies from the precompiled templates."""
+
+    def setUp(self):
+        """Set up notifier and sample results."""
+        mock_cred_manager = Mock()
+        mock_cred_manager.get_email_credentials.return_value = {
+            "from_address": "monitor@example.com",
+            "to_address": "ops@example.com",
+            "password": "secret",
+        }
+        self.notifier = EmailNotifier(
+            {"notifications": {"email": {"enabled": True}}}, mock_cred_manager
+        )
+        self.failure = CheckResult(
+            check_type="uptime",
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            status=CheckStatus.FAILURE,
+            success=False,
+            status_code=500,
+            response_time_ms=250.0,
+            error_message="<script>$boom</script>",
+            metrics={"dns": {"resolve_ms": 12}},
+        )
+        self.success = CheckResult(
+            check_type="authentication",
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            status=CheckStatus.SUCCESS,
+            success=True,
+        )
+
+    def test_html_email_escapes_and_fills_fields(self):
+        """Test that the HTML email contains sanitized values and metrics."""
+        html = self.notifier._create_html_email(self.failure, site_name="Site A")
+
+        self.assertIn("UPTIME - FAILURE", html)
+        self.assertIn("<strong>Site:</strong> Site A", html)
+        self.assertIn("HTTP Status:</strong> 500", html)
+        self.assertIn("&lt;script&gt;$boom&lt;/script&gt;", html)
+        self.assertIn("<td>dns.resolve_ms</td><td>12</td>", html)
+        self.assertNotIn("$status", html)
+
+    def test_batch_html_email_renders(self):
+        """Test that the batch HTML email renders counts and sections."""
+        results = [self.failure, self.success]
+        html = self.notifier._create_batch_html_email(
+            results, *EmailNotifier._partition_results(results)
+        )
+
+        self.assertIn("Total Checks: 2", html)
+        self.assertIn("Failures: 1", html)
+        self.assertIn('<h3 class="status-failure">Failures</h3>', html)
+        self.assertIn('<h3 class="status-success">Successes</h3>', html)
+        self.assertNotIn("Warnings</h3>", html)
+
+    def test_partition_results(self):
+        """Test that results are grouped by status in a single pass."""
+        warning = CheckResult(
+            check_type="health",
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            status=CheckStatus.WARNING,
+            success=True,
+        )
+        failures, warnings, successes = EmailNotifier._partition_results(
+            [self.success, self.failure, warning]
+        )
+
+        self.assertEqual(failures, [self.failure])
+        self.assertEqual(warnings, [warning])
+        self.assertEqual(successes, [self.success])
+
+    def test_alert_on_filters_email_types(self):
+        """Test that alert types outside alert_on are not sent."""
+        mock_cred_manager = Mock()
+        mock_cred_manager.get_email_credentials.return_value = {
+            "from_address": "monitor@example.com",
+            "to_address": "ops@example.com",
+            "password": "secret",
+        }
+        notifier = EmailNotifier(
+            {
+                "notifications": {
+                    "email": {
+                        "enabled": True,
+                        "to_addresses": ["ops@example.com"],
+                        "alert_on": ["recovery"],
+                    }
+                }
+            },
+            mock_cred_manager,
+        )
+
+        with patch.object(notifier, "_send_email", return_value=True) as mock_send:
+            self.assertFalse(notifier.notify(self.failure, site_name="Site A"))
+            self.assertTrue(
+                notifier.notify(self.success, self.failure, site_name="Site A")
+            )
+
+        mock_send.assert_called_once()
+
+    def test_batch_text_email_renders(self):
+        """Test that the batch text email lists each result."""
+        results = [self.failure, self.success]
+        text = self.notifier._create_batch_text_email(
+            results, *EmailNotifier._partition_results(results)
+        )
+
+        self.assertIn("- Total Checks: 2", text)
+        self.assertIn("  - uptime: <script>$boom</script> (250ms)", text)
+        self.assertIn("  - authentication: OK (0ms)", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
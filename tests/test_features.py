@@ -43,7 +43,7 @@ def load_config():
 
 def test_healthcheck_ping():
     """Test that HealthcheckMonitor sends pings correctly"""
-    with patch("httpx.post") as mock_post:
+    with patch("httpx.Client.post") as mock_post:
         mock_post.return_value.status_code = 200
 
         healthcheck_url = os.getenv("HEALTHCHECK_PING_URL")
@@ -51,12 +51,12 @@ def test_healthcheck_ping():
         print(f"Debug: HEALTHCHECK_PING_URL used in test: {healthcheck_url}")
         monitor = HealthcheckMonitor(ping_url=healthcheck_url, enabled=True)
         success = monitor.ping_success("Test message")
+        monitor.flush()
 
         assert success is True
         mock_post.assert_called_once_with(
             healthcheck_url,
-            data="Test message".encode("utf-8"),
-            timeout=5.0,
+            content="Test message".encode("utf-8"),
         )
 
 
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for HealthcheckMonitor pings.
+"""
+
+import subprocess
+import sys
+import textwrap
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.healthcheck import HealthcheckMonitor
+
+PING_URL = "https://hc-ping.com/test-uuid"
+
+
+class TestHealthcheckPings(unittest.TestCase):
+    """Test that pings go out over the monitor's HTTP client."""
+
+    def setUp(self):
+        """Create a monitor whose client records requests."""
+        self.requests = []
+        self.status_code = 200
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(self.status_code)
+
+        self.monitor = HealthcheckMonitor(ping_url=PING_URL)
+        self.monitor._client.close()
+        self.monitor._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def tearDown(self):
+        """Close the monitor's client."""
+        self.monitor.close()
+
+    def test_pings_share_client(self):
+        """Test that consecutive pings use the persistent client."""
+        self.assertTrue(self.monitor.ping_start())
+        self.assertTrue(self.monitor.ping_success("Checked 5 sites"))
+        self.monitor.flush()
+
+        self.assertEqual(
+            [str(r.url) for r in self.requests], [f"{PING_URL}/start", PING_URL]
+        )
+        self.assertEqual(self.requests[1].content, b"Checked 5 sites")
+
+    def test_http_error_returns_false(self):
+        """Test that a non-2xx response is reported as a failed ping."""
+        self.status_code = 500
+
+        self.assertFalse(self.monitor.ping_exit(1))
+
+    def test_exit_ping_sent_after_queued_pings(self):
+        """Test that ping_exit waits for queued pings and is sent last."""
+        self.monitor.ping_fail("Site down")
+        self.assertTrue(self.monitor.ping_exit(0))
+
+        self.assertEqual(
+            [str(r.url) for r in self.requests], [f"{PING_URL}/fail", f"{PING_URL}/0"]
+        )
+
+    def test_full_queue_drops_oldest_ping(self):
+        """Test that a slow endpoint never blocks ping_success."""
+        release = threading.Event()
+        sent = []
+
+        def slow_send(suffix, message):
+            release.wait(5)
+            sent.append(message)
+            return True
+
+        with patch.object(HealthcheckMonitor, "MAX_PENDING_PINGS", 2):
+            monitor = HealthcheckMonitor(ping_url=PING_URL)
+        with patch.object(monitor, "_send_ping", side_effect=slow_send):
+            for i in range(5):
+                self.assertTrue(monitor.ping_success(f"cycle {i}"))
+            release.set()
+            monitor.close()
+
+        # The first ping was in flight; of the rest only the newest two are kept
+        self.assertEqual(sent[-2:], ["cycle 3", "cycle 4"])
+        self.assertLessEqual(len(sent), 3)
+
+    def test_queued_ping_sent_at_interpreter_exit(self):
+        """Test that a process exiting without flush() still sends its ping."""
+        script = textwrap.dedent(
+            f"""
+            import sys, time
+            import httpx
+            sys.path.insert(0, {str(Path(__file__).parent.parent)!r})
+            from src.utils.healthcheck import HealthcheckMonitor
+
+            def handler(request):
+                time.sleep(0.2)
+                print("sent", request.url, flush=True)
+                return httpx.Response(200)
+
+            monitor = HealthcheckMonitor(ping_url={PING_URL!r})
+            monitor._client = httpx.Client(transport=httpx.MockTransport(handler))
+            monitor.ping_success("one-shot run")
+            """
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=30
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn(f"sent {PING_URL}", result.stdout)
+
+    def test_close_closes_client(self):
+        """Test that close() releases the HTTP client."""
+        self.monitor.close()
+
+        self.assertTrue(self.monitor._client.is_closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for logging utilities.
+"""
+
+import json
+import logging
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import logger as logger_module
+from src.utils.logger import JsonFormatter, get_context_logger, setup_logging
+
+
+class TestContextLogger(unittest.TestCase):
+    """Test the context prefix added by LoggerAdapter."""
+
+    def test_context_prefixed_to_messages(self):
+        """Test that every message carries the adapter's context."""
+        adapter = get_context_logger("test.context", site="Site A", check="uptime")
+
+        with self.assertLogs("test.context", level="INFO") as logs:
+            adapter.info("first")
+            adapter.info("count %d", 2)
+
+        self.assertEqual(
+            [record.getMessage() for record in logs.records],
+            [
+                "[site=Site A, check=uptime] first",
+                "[site=Site A, check=uptime] count 2",
+            ],
+        )
+
+    def test_refresh_prefix_after_context_change(self):
+        """Test that refresh_prefix picks up changes to extra."""
+        adapter = get_context_logger("test.context")
+        adapter.extra["site"] = "Site B"
+        adapter.refresh_prefix()
+
+        self.assertEqual(adapter.process("msg", {}), ("[site=Site B] msg", {}))
+
+    def test_no_context_leaves_message_unchanged(self):
+        """Test that an adapter without context passes messages through."""
+        adapter = get_context_logger("test.context")
+
+        self.assertEqual(adapter.process("msg", {}), ("msg", {}))
+        self.assertIsInstance(adapter.logger, logging.Logger)
+
+
+class TestSetupLogging(unittest.TestCase):
+    """Test the file logging pipeline built by setup_logging."""
+
+    def setUp(self):
+        """Save root logger state and create a log directory."""
+        self.root = logging.getLogger()
+        self.saved = (self.root.handlers[:], self.root.level)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        log_dir = Path(self.temp_dir.name)
+        self.config = {
+            "logging": {
+                "level": "INFO",
+                "file_path": str(log_dir / "monitor.log"),
+                "error_file_path": str(log_dir / "monitor.error.log"),
+            }
+        }
+
+    def tearDown(self):
+        """Stop the listener and restore the root logger."""
+        logger_module._stop_queue_listener()
+        self.root.handlers, level = self.saved
+        self.root.setLevel(level)
+        self.temp_dir.cleanup()
+
+    def test_file_records_written_by_listener(self):
+        """Test that records reach the log files through the queue listener."""
+        setup_logging(self.config, console=False)
+
+        self.assertEqual(len(self.root.handlers), 1)
+        self.assertIsInstance(self.root.handlers[0], logging.handlers.QueueHandler)
+
+        logging.getLogger("test.files").info("routine")
+        logging.getLogger("test.files").error("broken")
+        logger_module._stop_queue_listener()
+
+        main_log = Path(self.config["logging"]["file_path"]).read_text()
+        error_log = Path(self.config["logging"]["error_file_path"]).read_text()
+        self.assertIn("routine", main_log)
+        self.assertIn("broken", main_log)
+        self.assertNotIn("routine", error_log)
+        self.assertIn("broken", error_log)
+
+    def test_json_log_files(self):
+        """Test that logging.json writes one JSON object per line."""
+        self.config["logging"]["json"] = True
+        setup_logging(self.config, console=False)
+
+        logging.getLogger("test.json").warning("site %s down", "Site A")
+        logger_module._stop_queue_listener()
+
+        lines = Path(self.config["logging"]["file_path"]).read_text().splitlines()
+        entry = json.loads(lines[-1])
+        self.assertEqual(entry["msg"], "site Site A down")
+        self.assertEqual(entry["lvl"], "WARNING")
+        self.assertEqual(entry["name"], "test.json")
+        self.assertIsInstance(entry["ts"], float)
+
+    def test_json_log_files_keep_exception_separate(self):
+        """Test that tracebacks logged via setup_logging land in "exc"."""
+        self.config["logging"]["json"] = True
+        setup_logging(self.config, console=False)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("test.json").error("check failed", exc_info=True)
+        logger_module._stop_queue_listener()
+
+        lines = Path(self.config["logging"]["file_path"]).read_text().splitlines()
+        entry = json.loads(lines[-1])
+        self.assertEqual(entry["msg"], "check failed")
+        self.assertIn("ValueError: boom", entry["exc"])
+
+    def test_text_log_files_keep_traceback(self):
+        """Test that plain text log files still include the traceback."""
+        setup_logging(self.config, console=False)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("test.files").exception("check failed")
+        logger_module._stop_queue_listener()
+
+        main_log = Path(self.config["logging"]["file_path"]).read_text()
+        self.assertIn("check failed\nTraceback", main_log)
+        self.assertIn("ValueError: boom", main_log)
+
+    def test_json_formatter_includes_exception(self):
+        """Test that exception text is kept in JSON records."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.getLogger("test.json").makeRecord(
+                "test.json", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+            )
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertIn("ValueError: boom", entry["exc"])
+
+    def test_setup_again_replaces_listener(self):
+        """Test that calling setup_logging twice leaves one listener running."""
+        setup_logging(self.config, console=False)
+        first = logger_module._queue_listener
+        setup_logging(self.config, console=False)
+
+        self.assertIsNot(logger_module._queue_listener, first)
+        self.assertIsNone(first._thread)
+        self.assertEqual(len(self.root.handlers), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for MetricsCollector summary computation.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.metrics import MetricsCollector
+
+
+class TestMetricsSummaryCache(unittest.TestCase):
+    """Test that metric statistics are reused until new data is recorded."""
+
+    def test_summary_reuses_statistics_between_records(self):
+        """Test that repeated summaries do not recompute statistics."""
+        collector = MetricsCollector()
+        collector.record_check_result(True, 100.0)
+
+        with patch.object(
+            collector, "get_statistics", wraps=collector.get_statistics
+        ) as mock_stats:
+            first = collector.get_all_metrics_summary()
+            second = collector.get_all_metrics_summary()
+
+        self.assertEqual(first["metrics"], second["metrics"])
+        # One call per metric ("response_time_ms" and "success"), not per summary
+        self.assertEqual(mock_stats.call_count, 2)
+
+    def test_summary_refreshes_after_new_record(self):
+        """Test that recording a result invalidates cached statistics."""
+        collector = MetricsCollector()
+        collector.record_check_result(True, 100.0)
+        self.assertEqual(
+            collector.get_all_metrics_summary()["metrics"]["response_time_ms"]["count"],
+            1,
+        )
+
+        collector.record_check_result(False, 300.0)
+        summary = collector.get_all_metrics_summary()
+
+        self.assertEqual(summary["metrics"]["response_time_ms"]["count"], 2)
+        self.assertEqual(summary["availability"]["failed_checks"], 1)
+
+    def test_summary_after_reset(self):
+        """Test that reset clears cached statistics."""
+        collector = MetricsCollector()
+        collector.record_check_result(True, 100.0)
+        collector.get_all_metrics_summary()
+
+        collector.reset()
+
+        self.assertEqual(collector.get_all_metrics_summary()["metrics"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ are properly managed to prevent resource leaks in long-running monitors.
 """
 
 import gc
+import json
 import os
 import sys
 import unittest
@@ -173,36 +174,45 @@ class TestTelegramNotifierResourceManagement(unittest.TestCase):
             "chat_id": "test_chat_id",
         }
 
-    def test_telegram_notifier_no_persistent_client(self):
-        """Test that TelegramNotifier does not keep a persistent HTTP client."""
-        notifier = TelegramNotifier(self.config, self.mock_cred_manager)
+    def test_telegram_notifier_reuses_client(self):
+        """Test that consecutive messages share one pooled HTTP client."""
+        with patch("httpx.Client") as mock_client_class:
+            notifier = TelegramNotifier(self.config, self.mock_cred_manager)
+
+        mock_client_instance = mock_client_class.return_value
+        mock_response = Mock()
+        mock_response.json.return_value = {"ok": True}
+        mock_client_instance.post.return_value = mock_response
+
+        self.assertTrue(notifier._send_telegram_message("First"))
+        self.assertTrue(notifier._send_telegram_message("Second"))
 
-        # Should not have http_client attribute
-        self.assertFalse(hasattr(notifier, "http_client"))
+        mock_client_class.assert_called_once()
+        self.assertEqual(mock_client_instance.post.call_count, 2)
+        args, kwargs = mock_client_instance.post.call_args
+        self.assertEqual(args, ("https://api.telegram.org/bottest_token/sendMessage",))
+        self.assertEqual(
+            json.loads(kwargs["content"]),
+            {"chat_id": "test_chat_id", "text": "Second", "parse_mode": "MarkdownV2"},
+        )
+        self.assertEqual(kwargs["headers"], {"Content-Type": "application/json"})
 
     @patch("httpx.Client")
-    def test_telegram_message_uses_context_manager(self, mock_client_class):
-        """Test that _send_telegram_message uses context manager for HTTP client."""
+    def test_telegram_notifier_close_releases_client(self, mock_client_class):
+        """Test that close() closes the pooled HTTP client."""
         notifier = TelegramNotifier(self.config, self.mock_cred_manager)
 
-        # Mock the HTTP client and response
-        mock_client_instance = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"ok": True}
-        mock_client_instance.post.return_value = mock_response
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=False)
+        notifier.close()
 
-        mock_client_class.return_value = mock_client_instance
+        mock_client_class.return_value.close.assert_called_once()
 
-        # Send a message
-        result = notifier._send_telegram_message("Test message")
+    @patch("httpx.Client")
+    def test_telegram_notifier_context_manager(self, mock_client_class):
+        """Test that leaving a with-block closes the pooled HTTP client."""
+        with TelegramNotifier(self.config, self.mock_cred_manager) as notifier:
+            self.assertIsInstance(notifier, TelegramNotifier)
 
-        # Verify client was created with context manager
-        self.assertTrue(result)
-        mock_client_class.assert_called_once_with(timeout=10.0)
-        mock_client_instance.__enter__.assert_called_once()
-        mock_client_instance.__exit__.assert_called_once()
+        mock_client_class.return_value.close.assert_called_once()
 
 
 class TestMonitorCheckerCleanup(unittest.TestCase):
@@ -326,9 +336,13 @@ class TestThreadPoolExecutor(unittest.TestCase):
         self.assertIsNotNone(monitor.bot_executor)
         self.assertEqual(monitor.bot_executor._max_workers, 2)
         self.assertTrue(monitor.bot_executor._thread_name_prefix.startswith("bot_cmd"))
+        self.assertTrue(
+            monitor._notifier_pool._thread_name_prefix.startswith("notify")
+        )
 
         # Cleanup
         monitor.bot_executor.shutdown(wait=False)
+        monitor._notifier_pool.shutdown(wait=False)
 
     @patch("src.monitor.CredentialManager")
     @patch("src.monitor.StateManager")
@@ -380,6 +394,7 @@ class TestThreadPoolExecutor(unittest.TestCase):
 
         # Executor should be shut down (checking _shutdown attribute)
         self.assertTrue(monitor.bot_executor._shutdown)
+        self.assertTrue(monitor._notifier_pool._shutdown)
 
 
 class TestMemoryLeakPrevention(unittest.TestCase):
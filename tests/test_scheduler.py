@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Tests for MonitorScheduler.
+"""
+
+import gc
+import sys
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from apscheduler.events import EVENT_JOB_ERROR
+
+from src.scheduler import MonitorScheduler
+
+
+def noop():
+    """Job that does nothing."""
+
+
+class TestMaxWorkers(unittest.TestCase):
+    """Test sizing of the job thread pool."""
+
+    def test_configured_value(self):
+        """Test that scheduler_max_workers is used when set."""
+        scheduler = MonitorScheduler(
+            {"monitoring": {"scheduler_max_workers": 2}}, blocking=False
+        )
+        self.assertEqual(scheduler._get_max_workers(), 2)
+
+    def test_default_scales_with_cpus(self):
+        """Test that the default is capped by the CPU count."""
+        scheduler = MonitorScheduler({}, blocking=False)
+
+        with patch("src.scheduler.os.cpu_count", return_value=1):
+            self.assertEqual(scheduler._get_max_workers(), 2)
+        with patch("src.scheduler.os.cpu_count", return_value=16):
+            self.assertEqual(scheduler._get_max_workers(), 5)
+        with patch("src.scheduler.os.cpu_count", return_value=None):
+            self.assertEqual(scheduler._get_max_workers(), 2)
+
+
+class TestJobListing(unittest.TestCase):
+    """Test job listing helpers."""
+
+    def setUp(self):
+        """Create a running background scheduler with a few jobs."""
+        self.scheduler = MonitorScheduler({}, blocking=False)
+        self.scheduler.start()
+        self.scheduler.add_interval_job("slow", noop, minutes=30)
+        self.scheduler.add_interval_job("fast", noop, seconds=90)
+        self.scheduler.add_interval_job("medium", noop, minutes=10)
+
+    def tearDown(self):
+        """Stop the scheduler."""
+        self.scheduler.shutdown(wait=False)
+
+    def test_next_run_times_sorted_and_limited(self):
+        """Test that upcoming runs are ordered by time and capped at count."""
+        upcoming = self.scheduler.get_next_run_times(count=2)
+
+        self.assertEqual([u["job_id"] for u in upcoming], ["fast", "medium"])
+
+    def test_list_jobs(self):
+        """Test that every job is described."""
+        jobs = {job["id"]: job for job in self.scheduler.list_jobs()}
+
+        self.assertEqual(set(jobs), {"slow", "fast", "medium"})
+        self.assertEqual(jobs["fast"]["name"], "Monitor Job: fast")
+        self.assertIn("0:01:30", jobs["fast"]["trigger"])
+
+    def test_same_cron_schedule_shares_trigger(self):
+        """Test that jobs on the same cron schedule reuse one trigger instance."""
+        self.scheduler.add_cron_job("daily", noop, hour=9, minute=0)
+        self.scheduler.add_cron_job("daily2", noop, hour=9, minute=0)
+        self.scheduler.add_cron_job(
+            "weekly", noop, hour=9, minute=0, day_of_week="mon"
+        )
+
+        self.assertIs(
+            self.scheduler.jobs["daily2"].trigger, self.scheduler.jobs["daily"].trigger
+        )
+        self.assertIsNot(
+            self.scheduler.jobs["weekly"].trigger, self.scheduler.jobs["daily"].trigger
+        )
+
+    def test_interval_job_anchored_at_creation(self):
+        """Test that each interval job gets its own trigger anchored when added."""
+        added = datetime.now(timezone.utc)
+        self.scheduler.add_interval_job("slow2", noop, minutes=30)
+
+        trigger = self.scheduler.jobs["slow2"].trigger
+        self.assertIsNot(trigger, self.scheduler.jobs["slow"].trigger)
+        self.assertGreaterEqual(trigger.start_date, added + timedelta(minutes=30))
+
+    def test_trigger_description_refreshed_on_reschedule(self):
+        """Test that a rescheduled job is not described with its old trigger."""
+        self.assertIn("0:30:00", self.scheduler.get_job_info("slow")["trigger"])
+
+        self.scheduler.add_interval_job("slow", noop, minutes=45)
+
+        self.assertIn("0:45:00", self.scheduler.get_job_info("slow")["trigger"])
+
+    def test_job_kwargs_bound_to_function(self):
+        """Test that job arguments are bound once instead of passed per run."""
+        done = threading.Event()
+        seen = {}
+
+        def record(site):
+            seen["site"] = site
+            done.set()
+
+        self.scheduler.add_interval_job("bound", record, minutes=30, site="AEMET")
+        self.assertEqual(self.scheduler.jobs["bound"].kwargs, {})
+
+        self.scheduler.run_job_now("bound")
+
+        self.assertTrue(done.wait(timeout=5))
+        self.assertEqual(seen, {"site": "AEMET"})
+
+    def test_removed_job_not_retained(self):
+        """Test that the local registry doesn't keep removed jobs alive."""
+        self.assertIn("slow", self.scheduler.jobs)
+
+        self.assertTrue(self.scheduler.remove_job("slow"))
+        self.scheduler.add_interval_job("medium", noop, minutes=20)
+        gc.collect()
+
+        self.assertNotIn("slow", self.scheduler.jobs)
+        self.assertIn("medium", self.scheduler.jobs)
+        self.assertEqual(
+            self.scheduler.get_job_info("medium")["name"], "Monitor Job: medium"
+        )
+
+    def test_run_job_now_unknown_job(self):
+        """Test that triggering an unknown job reports failure."""
+        self.assertFalse(self.scheduler.run_job_now("missing"))
+
+    def test_run_job_now_keeps_schedule(self):
+        """Test that an immediate run doesn't move the job's next run time."""
+        done = threading.Event()
+        self.scheduler.add_interval_job("triggered", done.set, minutes=30)
+        next_run = self.scheduler.scheduler.get_job("triggered").next_run_time
+
+        self.assertTrue(self.scheduler.run_job_now("triggered"))
+
+        self.assertTrue(done.wait(timeout=5))
+        self.assertEqual(
+            self.scheduler.scheduler.get_job("triggered").next_run_time, next_run
+        )
+
+    def test_run_job_now_while_running(self):
+        """Test that triggering a job that is still running is not an error."""
+        started, release = threading.Event(), threading.Event()
+
+        def busy():
+            started.set()
+            release.wait(5)
+
+        self.scheduler.add_interval_job("busy", busy, minutes=30)
+        self.assertTrue(self.scheduler.run_job_now("busy"))
+        self.assertTrue(started.wait(timeout=5))
+
+        with self.assertLogs("MonitorScheduler", level="INFO") as logs:
+            self.assertTrue(self.scheduler.run_job_now("busy"))
+        release.set()
+
+        self.assertIn("already running", logs.output[0])
+
+    def test_job_error_logged_with_name(self):
+        """Test that job failures are logged with the registered job name."""
+
+        def failing():
+            raise RuntimeError("boom")
+
+        done = threading.Event()
+        self.scheduler.scheduler.add_listener(
+            lambda event: done.set(), EVENT_JOB_ERROR
+        )
+
+        with self.assertLogs("MonitorScheduler", level="ERROR") as logs:
+            self.scheduler.add_one_time_job(
+                "fails", failing, run_date=datetime.now(timezone.utc)
+            )
+            self.assertTrue(done.wait(timeout=5))
+
+        self.assertIn("One-time Job: fails", logs.output[0])
+        self.assertIn("boom", logs.output[0])
+
+
+class TestAsyncioExecutor(unittest.TestCase):
+    """Test the opt-in asyncio scheduler mode."""
+
+    def setUp(self):
+        """Create a background scheduler running on an event loop."""
+        self.scheduler = MonitorScheduler(
+            {"monitoring": {"scheduler_executor": "asyncio"}}, blocking=False
+        )
+        self.scheduler.start()
+
+    def tearDown(self):
+        """Stop the scheduler and its loop thread."""
+        self.scheduler.shutdown()
+
+    def test_runs_coroutine_job(self):
+        """Test that coroutine jobs are awaited on the scheduler loop."""
+        done = threading.Event()
+
+        async def job():
+            done.set()
+
+        self.scheduler.add_one_time_job(
+            "coro", job, run_date=datetime.now(timezone.utc)
+        )
+
+        self.assertTrue(done.wait(timeout=5))
+
+    def test_runs_plain_function_job(self):
+        """Test that regular functions still run."""
+        done = threading.Event()
+
+        self.scheduler.add_one_time_job(
+            "func", done.set, run_date=datetime.now(timezone.utc)
+        )
+
+        self.assertTrue(done.wait(timeout=5))
+
+    def test_shutdown_stops_loop_thread(self):
+        """Test that shutdown() stops the scheduler and joins its thread."""
+        loop_thread = self.scheduler._loop_thread
+
+        self.scheduler.shutdown()
+
+        self.assertFalse(self.scheduler.scheduler.running)
+        self.assertFalse(loop_thread.is_alive())
+
+
+    def test_start_failure_raised_to_caller(self):
+        """Test that an error starting the scheduler is raised, not hung on."""
+        scheduler = MonitorScheduler(
+            {"monitoring": {"scheduler_executor": "asyncio"}}, blocking=False
+        )
+        errors = []
+
+        def start():
+            try:
+                scheduler.start()
+            except RuntimeError as e:
+                errors.append(e)
+
+        with patch.object(
+            scheduler.scheduler, "start", side_effect=RuntimeError("bad jobstore")
+        ):
+            caller = threading.Thread(target=start, daemon=True)
+            caller.start()
+            caller.join(timeout=5)
+
+        self.assertFalse(caller.is_alive())
+        self.assertEqual([str(e) for e in errors], ["bad jobstore"])
+        self.assertIsNone(scheduler._loop_thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -262,6 +262,17 @@ class TestConfigValidation:
         with pytest.raises(ConfigValidationError, match="Private"):
             ConfigValidator.validate_url("http://192.168.1.1", "test_url")
 
+    def test_config_validator_blocks_alternate_ip_spellings(self):
+        """Test that trailing-dot and legacy IPv4 forms are treated as IPs."""
+        for host in ["10.0.0.1.", "10.1", "0xa000001", "172.16.0.1"]:
+            with pytest.raises(ConfigValidationError, match="Private"):
+                ConfigValidator.validate_url(f"http://{host}/", "test_url")
+
+    def test_config_validator_checks_ip_networks_not_prefixes(self):
+        """Test that hostnames and public IPs resembling private ranges pass."""
+        for host in ["172.160.1.1", "10.example.com", "192.168.example.com"]:
+            ConfigValidator.validate_url(f"http://{host}/", "test_url")
+
     def test_config_validator_blocks_metadata(self):
         """Test that config validator blocks cloud metadata endpoints."""
         with pytest.raises(ConfigValidationError, match="metadata"):
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Tests for StateManager persistence.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.checkers import CheckResult, CheckStatus
+from src.storage import StateManager
+
+
+def make_result(check_type="uptime", status=CheckStatus.SUCCESS):
+    """Create a check result for tests."""
+    return CheckResult(
+        check_type=check_type,
+        timestamp=datetime.now(),
+        status=status,
+        success=status == CheckStatus.SUCCESS,
+        status_code=200,
+        response_time_ms=120.0,
+    )
+
+
+class TestStateManagerRecording(unittest.TestCase):
+    """Test recording results and persisting them."""
+
+    def setUp(self):
+        """Create a temporary state file location."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_file = Path(self.temp_dir) / "monitor_state.json"
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_record_results_appends_to_log(self):
+        """Test that record_results appends to the log without a snapshot."""
+        manager = StateManager(str(self.state_file))
+
+        with patch.object(manager, "save_state", wraps=manager.save_state) as mock_save:
+            manager.record_results(
+                [
+                    (make_result("uptime"), "SiteA"),
+                    (make_result("authentication"), "SiteA"),
+                    (make_result("uptime", CheckStatus.FAILURE), "SiteB"),
+                ]
+            )
+
+        mock_save.assert_not_called()
+        self.assertEqual(manager.state["global"]["total_checks"], 3)
+        self.assertEqual(
+            manager.get_last_result("uptime", "SiteB")["status"], "failure"
+        )
+        self.assertEqual(len(manager.log_file.read_text().splitlines()), 3)
+        manager.close()
+
+    def test_log_replayed_on_load(self):
+        """Test that results only in the log are restored by a new manager."""
+        manager = StateManager(str(self.state_file))
+        manager.record_result(make_result("uptime"), "SiteA")
+        manager.record_result(make_result("uptime", CheckStatus.FAILURE), "SiteA")
+        manager._close_log()
+
+        reloaded = StateManager(str(self.state_file))
+
+        self.assertEqual(reloaded.state["global"]["total_checks"], 2)
+        self.assertEqual(reloaded.get_consecutive_failures("uptime", "SiteA"), 1)
+        self.assertEqual(len(reloaded.get_history("uptime", site_name="SiteA")), 2)
+        reloaded.close()
+
+    def test_snapshot_truncates_log(self):
+        """Test that every snapshot_every results the state file is rewritten."""
+        manager = StateManager(str(self.state_file), snapshot_every=2)
+
+        manager.record_result(make_result("uptime"), "SiteA")
+        self.assertFalse(self.state_file.exists())
+
+        manager.record_result(make_result("uptime"), "SiteA")
+        self.assertTrue(self.state_file.exists())
+        self.assertFalse(manager.log_file.exists())
+
+    def test_entries_in_snapshot_not_replayed(self):
+        """Test that a log left behind after a snapshot isn't applied twice."""
+        manager = StateManager(str(self.state_file))
+        manager.record_result(make_result("uptime"), "SiteA")
+        leftover = manager.log_file.read_text()
+        manager.close()
+
+        # Simulate a crash between writing the snapshot and removing the log
+        manager.log_file.write_text(leftover)
+        reloaded = StateManager(str(self.state_file))
+
+        self.assertEqual(reloaded.state["global"]["total_checks"], 1)
+
+    def test_unreadable_log_line_skipped(self):
+        """Test that a partial last line from a crash is ignored."""
+        manager = StateManager(str(self.state_file))
+        manager.record_result(make_result("uptime"), "SiteA")
+        manager._close_log()
+        with open(manager.log_file, "a") as f:
+            f.write('{"seq": 2, "t": "2024')
+
+        reloaded = StateManager(str(self.state_file))
+
+        self.assertEqual(reloaded.state["global"]["total_checks"], 1)
+
+    def test_record_results_empty(self):
+        """Test that an empty batch does not touch the state file."""
+        manager = StateManager(str(self.state_file))
+        manager.record_results([])
+        self.assertFalse(self.state_file.exists())
+
+    def test_record_result_defers_save_until_flush(self):
+        """Test that the state file is only written by flush()."""
+        manager = StateManager(str(self.state_file))
+
+        with patch.object(manager, "save_state", wraps=manager.save_state) as mock_save:
+            manager.record_result(make_result("uptime"), "SiteA")
+            manager.record_result(make_result("uptime"), "SiteB")
+            self.assertFalse(self.state_file.exists())
+
+            manager.flush()
+            manager.flush()
+
+        mock_save.assert_called_once()
+        self.assertTrue(self.state_file.exists())
+        self.assertFalse(manager.log_file.exists())
+
+    def test_history_bounded_by_history_size(self):
+        """Test that history keeps only the newest history_size results."""
+        manager = StateManager(str(self.state_file), history_size=3)
+        for code in range(5):
+            result = make_result("uptime")
+            result.status_code = code
+            manager.record_result(result, "SiteA")
+        manager.close()
+
+        for loaded in (manager, StateManager(str(self.state_file), history_size=3)):
+            history = loaded.get_history("uptime", count=10, site_name="SiteA")
+            self.assertEqual([r["status_code"] for r in history], [2, 3, 4])
+            self.assertEqual(
+                [r["status_code"] for r in loaded.get_history("uptime", 2, "SiteA")],
+                [3, 4],
+            )
+
+    def test_result_serialized_once(self):
+        """Test that recording a result calls to_dict() only once."""
+        manager = StateManager(str(self.state_file))
+        result = make_result("uptime")
+
+        with patch.object(
+            CheckResult, "to_dict", autospec=True, side_effect=CheckResult.to_dict
+        ) as mock_to_dict:
+            manager.record_result(result, "SiteA")
+        manager.close()
+
+        mock_to_dict.assert_called_once_with(result)
+        self.assertIs(
+            manager.get_last_result("uptime", "SiteA"),
+            manager.state["sites"]["SiteA"]["history"]["uptime"][-1],
+        )
+
+    def test_unchanged_state_not_rewritten(self):
+        """Test that saving identical state skips the file write."""
+        manager = StateManager(str(self.state_file))
+        manager.record_result(make_result("uptime"), "SiteA")
+        self.assertTrue(manager.save_state())
+
+        with patch("src.storage.state_manager.os.replace") as mock_replace:
+            self.assertTrue(manager.save_state())
+            manager.clear_history("authentication", "SiteA")
+
+        mock_replace.assert_not_called()
+
+    def test_durability_modes(self):
+        """Test which fsync calls each durability mode makes."""
+        expected = {"none": 0, "fsync": 1, "fsync+dir": 2}
+        for durability, fsyncs in expected.items():
+            with self.subTest(durability=durability):
+                manager = StateManager(str(self.state_file), durability=durability)
+                manager.record_result(make_result("uptime"), durability)
+
+                with patch(
+                    "src.storage.state_manager.os.fsync", wraps=os.fsync
+                ) as mock_fsync:
+                    self.assertTrue(manager.flush())
+
+                self.assertEqual(mock_fsync.call_count, fsyncs)
+
+        with self.assertRaises(ValueError):
+            StateManager(str(self.state_file), durability="sometimes")
+
+    def test_reads_do_not_create_sites(self):
+        """Test that querying an unknown site leaves the state untouched."""
+        manager = StateManager(str(self.state_file))
+
+        self.assertIsNone(manager.get_last_result("uptime", "Ghost"))
+        self.assertEqual(manager.get_history("uptime", site_name="Ghost"), [])
+        self.assertEqual(manager.get_statistics("Ghost"), {})
+        self.assertEqual(manager.get_consecutive_failures("uptime", "Ghost"), 0)
+        self.assertFalse(manager.is_recovering("uptime", "Ghost"))
+        self.assertEqual(manager.get_summary("Ghost"), {})
+        manager.clear_history(site_name="Ghost")
+
+        self.assertEqual(manager.get_all_sites(), [])
+
+    def test_summary_cached_until_state_changes(self):
+        """Test that the all-sites summary is rebuilt only after a change."""
+        manager = StateManager(str(self.state_file))
+        manager.record_result(make_result("uptime"), "SiteA")
+
+        first = manager.get_summary()
+        self.assertIs(manager.get_summary(), first)
+        self.assertEqual(
+            first["sites"]["SiteA"]["current_status"]["uptime"]["status"], "success"
+        )
+
+        manager.record_result(make_result("uptime", CheckStatus.FAILURE), "SiteA")
+        second = manager.get_summary()
+
+        self.assertIsNot(second, first)
+        self.assertEqual(
+            second["sites"]["SiteA"]["current_status"]["uptime"]["status"], "failure"
+        )
+        manager.close()
+
+    def test_cached_summary_not_changed_by_later_checks(self):
+        """Test that a cached summary does not share nested state dicts."""
+        manager = StateManager(str(self.state_file))
+        manager.record_result(make_result("uptime", CheckStatus.FAILURE), "SiteA")
+
+        stats = manager.get_summary()["sites"]["SiteA"]["statistics"]
+        manager.record_result(make_result("uptime", CheckStatus.FAILURE), "SiteA")
+
+        self.assertEqual(stats["consecutive_failures"], {"uptime": 1})
+        self.assertEqual(manager.get_consecutive_failures("uptime", "SiteA"), 2)
+        manager.close()
+
+    def test_least_recently_checked_site_evicted(self):
+        """Test that max_sites drops the site checked longest ago."""
+        manager = StateManager(str(self.state_file), max_sites=2)
+
+        for site in ("SiteA", "SiteB", "SiteA", "SiteC"):
+            manager.record_result(make_result("uptime"), site)
+        manager.close()
+
+        self.assertEqual(manager.get_all_sites(), ["SiteA", "SiteC"])
+        reloaded = StateManager(str(self.state_file), max_sites=2)
+        self.assertEqual(reloaded.get_all_sites(), ["SiteA", "SiteC"])
+
+    def test_compressed_state_round_trip(self):
+        """Test that a gzip-compressed state file is detected and loaded."""
+        manager = StateManager(str(self.state_file), compress=True)
+        manager.record_result(make_result("uptime"), "SiteA")
+        self.assertTrue(manager.flush())
+
+        self.assertEqual(self.state_file.read_bytes()[:2], b"\x1f\x8b")
+        reloaded = StateManager(str(self.state_file))
+        self.assertEqual(reloaded.state["global"]["total_checks"], 1)
+
+    def test_recovery_times_kept_as_datetimes(self):
+        """Test that failure/recovery times compare as datetimes across reloads."""
+        manager = StateManager(str(self.state_file))
+        manager.record_result(make_result("uptime", CheckStatus.FAILURE), "SiteA")
+        self.assertTrue(manager.is_recovering("uptime", "SiteA"))
+
+        manager.record_result(make_result("uptime"), "SiteA")
+        manager.close()
+
+        reloaded = StateManager(str(self.state_file))
+        stats = reloaded.state["sites"]["SiteA"]["statistics"]
+        self.assertIsInstance(stats["last_failure_time"]["uptime"], datetime)
+        self.assertFalse(reloaded.is_recovering("uptime", "SiteA"))
+        self.assertIsInstance(
+            reloaded.get_summary("SiteA")["statistics"]["last_recovery_time"]["uptime"],
+            str,
+        )
+
+    def test_statistics_report_times_as_strings(self):
+        """Test that get_statistics keeps returning ISO strings for times."""
+        manager = StateManager(str(self.state_file))
+        failure = make_result("uptime", CheckStatus.FAILURE)
+        manager.record_result(failure, "SiteA")
+
+        stats = manager.get_statistics("SiteA")
+
+        self.assertEqual(
+            stats["last_failure_time"], {"uptime": failure.timestamp.isoformat()}
+        )
+        self.assertEqual(stats["consecutive_failures"], {"uptime": 1})
+        json.dumps(stats)
+        manager.close()
+
+    def test_state_directory_created_once(self):
+        """Test that the state directory is created on first save only."""
+        nested = Path(self.temp_dir) / "nested" / "monitor_state.json"
+        manager = StateManager(str(nested))
+
+        real_mkdir = Path.mkdir
+
+        with patch.object(
+            Path, "mkdir", autospec=True, side_effect=real_mkdir
+        ) as mock_mkdir:
+            for status in (CheckStatus.SUCCESS, CheckStatus.FAILURE):
+                manager.record_result(make_result("uptime", status), "SiteA")
+                self.assertTrue(manager.flush())
+
+        mock_mkdir.assert_called_once()
+        self.assertTrue(nested.exists())
+
+    def test_state_round_trip(self):
+        """Test that saved state is loaded back by a new manager."""
+        manager = StateManager(str(self.state_file))
+        manager.record_result(make_result("uptime"), "SiteA")
+        self.assertTrue(manager.flush())
+
+        with open(self.state_file) as f:
+            self.assertIn("SiteA", json.load(f)["sites"])
+
+        reloaded = StateManager(str(self.state_file))
+        self.assertEqual(reloaded.state["global"]["total_checks"], 1)
+        self.assertNotIn("log_seq", reloaded.state)
+        self.assertTrue(reloaded.get_last_result("uptime", "SiteA")["success"])
+        self.assertEqual(len(reloaded.get_history("uptime", site_name="SiteA")), 1)
+
+    def test_round_trip_without_orjson(self):
+        """Test that the stdlib JSON fallback writes a loadable state file."""
+        with patch("src.storage.state_manager.ORJSON_AVAILABLE", False):
+            manager = StateManager(str(self.state_file))
+            manager.record_result(make_result("uptime"), "SiteA")
+            self.assertTrue(manager.flush())
+
+        reloaded = StateManager(str(self.state_file))
+        self.assertEqual(reloaded.state["global"]["total_checks"], 1)
+        self.assertIsInstance(reloaded.state["global"]["last_check_time"], datetime)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Tests for TelegramNotifier message formatting.
+"""
+
+import asyncio
+import json
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import httpx
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.checkers import CheckResult, CheckStatus
+from src.notifiers.telegram_notifier import TelegramNotifier
+
+
+class TestTelegramMarkdownEscaping(unittest.TestCase):
+    """Test MarkdownV2 escaping of user-controlled text."""
+
+    def setUp(self):
+        """Set up notifier with mocked credentials."""
+        mock_cred_manager = Mock()
+        mock_cred_manager.get_telegram_credentials.return_value = {
+            "bot_token": "test_token",
+            "chat_id": "test_chat_id",
+        }
+        self.notifier = TelegramNotifier(
+            {"notifications": {"telegram": {"enabled": True}}}, mock_cred_manager
+        )
+
+    def tearDown(self):
+        """Release the notifier's HTTP client."""
+        self.notifier.close()
+
+    def test_escapes_every_special_character(self):
+        """Test that each MarkdownV2 special character gets a backslash."""
+        special = "_*[]()~`>#+-=|{}.!"
+        escaped = self.notifier._escape_markdown(special)
+
+        self.assertEqual(escaped, "".join("\\" + c for c in special))
+
+    def test_plain_text_unchanged(self):
+        """Test that text without special characters is returned as-is."""
+        text = "Site A 200 OK"
+        self.assertEqual(self.notifier._escape_markdown(text), text)
+
+    def test_empty_and_non_string(self):
+        """Test that empty values and non-strings are handled."""
+        self.assertEqual(self.notifier._escape_markdown(""), "")
+        self.assertEqual(self.notifier._escape_markdown(None), "")
+        self.assertEqual(self.notifier._escape_markdown(1.5), "1\\.5")
+
+
+class TestTelegramPayload(unittest.TestCase):
+    """Test the pre-serialized sendMessage request body."""
+
+    def setUp(self):
+        """Set up notifier with mocked credentials."""
+        mock_cred_manager = Mock()
+        mock_cred_manager.get_telegram_credentials.return_value = {
+            "bot_token": "test_token",
+            "chat_id": "-100123",
+        }
+        self.notifier = TelegramNotifier(
+            {"notifications": {"telegram": {"enabled": True}}}, mock_cred_manager
+        )
+
+    def tearDown(self):
+        """Release the notifier's HTTP client."""
+        self.notifier.close()
+
+    def test_payload_is_valid_json(self):
+        """Test that the spliced body decodes to the expected request."""
+        message = 'Site \\[A\\] "down" ✅\nline two'
+        body = self.notifier._build_payload(message)
+
+        self.assertEqual(
+            json.loads(body),
+            {"chat_id": "-100123", "parse_mode": "MarkdownV2", "text": message},
+        )
+
+    def test_payload_without_orjson(self):
+        """Test that the stdlib json fallback produces the same request."""
+        with patch("src.notifiers.telegram_notifier.ORJSON_AVAILABLE", False):
+            notifier = TelegramNotifier(
+                self.notifier.config, self.notifier.credential_manager
+            )
+            body = notifier._build_payload("hello")
+            notifier.close()
+
+        self.assertEqual(
+            json.loads(body),
+            {"chat_id": "-100123", "parse_mode": "MarkdownV2", "text": "hello"},
+        )
+
+
+class TestTelegramBatchFormatting(unittest.TestCase):
+    """Test the condensed batch message."""
+
+    def setUp(self):
+        """Set up notifier with mocked credentials."""
+        mock_cred_manager = Mock()
+        mock_cred_manager.get_telegram_credentials.return_value = {
+            "bot_token": "test_token",
+            "chat_id": "test_chat_id",
+        }
+        self.notifier = TelegramNotifier(
+            {"notifications": {"telegram": {"enabled": True}}}, mock_cred_manager
+        )
+
+    def tearDown(self):
+        """Release the notifier's HTTP client."""
+        self.notifier.close()
+
+    def test_batch_escapes_each_site_once(self):
+        """Test that repeated sites are escaped once and listed per result."""
+        results = [
+            (
+                CheckResult(
+                    check_type=check_type,
+                    timestamp=datetime.now(),
+                    status=CheckStatus.SUCCESS,
+                    success=True,
+                    response_time_ms=120.0,
+                ),
+                None,
+                "site.example",
+            )
+            for check_type in ("uptime", "authentication", "health")
+        ]
+
+        with patch.object(
+            self.notifier, "_escape_markdown", wraps=self.notifier._escape_markdown
+        ) as mock_escape:
+            message = self.notifier._format_batch_message(results)
+
+        mock_escape.assert_called_once_with("site.example")
+        self.assertEqual(message.count("site\\.example"), 3)
+        self.assertIn("✅ 3 OK", message)
+
+    def test_notify_batch_filters_once_per_result(self):
+        """Test that notify_batch evaluates should_notify once per result."""
+        results = [
+            (
+                CheckResult(
+                    check_type="uptime",
+                    timestamp=datetime.now(),
+                    status=status,
+                    success=status == CheckStatus.SUCCESS,
+                ),
+                None,
+                "Site A",
+            )
+            for status in (CheckStatus.SUCCESS, CheckStatus.FAILURE)
+        ]
+
+        with patch.object(
+            self.notifier, "should_notify", wraps=self.notifier.should_notify
+        ) as mock_should, patch.object(
+            self.notifier, "_send_telegram_message", return_value=True
+        ) as mock_send:
+            self.assertTrue(self.notifier.notify_batch(results))
+
+        self.assertEqual(mock_should.call_count, 2)
+        message = mock_send.call_args.args[0]
+        self.assertIn("❌ 1 FAIL", message)
+        self.assertNotIn("OK", message)
+
+    def test_notify_individually_sends_each_result(self):
+        """Test that individual mode posts one message per notifiable result."""
+        results = [
+            (
+                CheckResult(
+                    check_type="uptime",
+                    timestamp=datetime.now(),
+                    status=CheckStatus.FAILURE,
+                    success=False,
+                    error_message="down",
+                ),
+                None,
+                site,
+            )
+            for site in ("Site A", "Site B")
+        ]
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        transport = httpx.MockTransport(handler)
+        real_async_client = httpx.AsyncClient
+
+        with patch(
+            "src.notifiers.telegram_notifier.httpx.AsyncClient",
+            side_effect=lambda **kwargs: real_async_client(transport=transport),
+        ):
+            self.assertTrue(self.notifier.notify_individually(results))
+
+        self.assertEqual(len(requests), 2)
+        self.assertTrue(
+            all(r.url.path == "/bottest_token/sendMessage" for r in requests)
+        )
+
+
+    def test_sync_and_async_sends_share_error_handling(self):
+        """Test that both send paths report API and HTTP errors the same way."""
+        responses = {
+            "ok": (200, {"ok": True}),
+            "api_error": (200, {"ok": False, "description": "bad request"}),
+            "http_error": (429, {"ok": False}),
+        }
+
+        for name, (status_code, payload) in responses.items():
+            transport = httpx.MockTransport(
+                lambda request, c=status_code, p=payload: httpx.Response(c, json=p)
+            )
+            expected = name == "ok"
+            with self.subTest(name, path="sync"):
+                self.notifier.http_client = httpx.Client(transport=transport)
+                self.assertEqual(
+                    self.notifier._send_telegram_message("hello"), expected
+                )
+            with self.subTest(name, path="async"):
+
+                async def send():
+                    async with httpx.AsyncClient(transport=transport) as client:
+                        return await self.notifier._send_telegram_message_async(
+                            client, "hello"
+                        )
+
+                self.assertEqual(asyncio.run(send()), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()